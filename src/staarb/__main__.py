@@ -1,3 +1,5 @@
+import logging
+
 import click
 
 from staarb.cli import backtest
@@ -5,7 +7,7 @@ from staarb.cli import backtest
 
 @click.group()
 def cli():
-    pass
+    logging.basicConfig(level=logging.INFO)
 
 
 cli.add_command(backtest.backtest)
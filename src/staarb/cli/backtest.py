@@ -41,7 +41,16 @@ from staarb.utils import async_cmd, date_to_milliseconds
 )
 @click.option("--api-key", envvar="BINANCE_API_KEY", help="Binance API key.")
 @click.option("--api-secret", envvar="BINANCE_API_SECRET", help="Binance API secret key.")
+@click.option(
+    "--precision",
+    default="float64",
+    type=click.Choice(["float64", "float32"]),
+    help="Floating point precision of the klines (default: float64).",
+)
 @click.option("--save/--no-save", default=True, help="Save backtest results for dashboard analysis.")
+@click.option(
+    "--cache/--no-cache", default=True, help="Reuse klines of past backtest windows cached on disk."
+)
 @click.option(
     "--storage-url", default="sqlite:///trading_data.db", help="URL for the storage backend (optional)."
 )
@@ -57,20 +66,22 @@ async def backtest(  # noqa: PLR0913
     env_file: str | None,
     api_key: str | None,
     api_secret: str | None,
+    precision: str,
     *,
     save: bool,
+    cache: bool,
     storage_url: str,
 ):
     """Run a backtest for the given SYMBOLS between START_DATE and END_DATE."""
     click.echo(f"Running backtest for symbols: {', '.join(symbols)}")
 
-    # Load environment file if provided and exists
-    if env_file and Path(env_file).exists():
+    # Load environment file if provided and exists, otherwise fall back to the default .env
+    if env_file and Path(env_file).is_file():
         load_dotenv(dotenv_path=env_file)
-    elif env_file:
-        click.echo(f"Warning: Environment file {env_file} not found. Continuing without it.")
-
-    load_dotenv()  # Load default .env if exists
+    else:
+        if env_file:
+            click.echo(f"Warning: Environment file {env_file} not found. Continuing without it.")
+        load_dotenv()  # Load default .env if exists
 
     api_key = api_key or os.getenv("BINANCE_API_KEY")
     api_secret = api_secret or os.getenv("BINANCE_API_SECRET")
@@ -85,8 +96,9 @@ async def backtest(  # noqa: PLR0913
         ######## Create a mock client for backtesting ########
         client = await MockClient.create(
             symbols,
-            DataRequest(interval, start_time, end_time),
+            DataRequest(interval, start_time, end_time, dtype=precision),
             balance={"USDC": 1000},
+            cache=cache,
             api_key=api_key,
             api_secret=api_secret,
         )
@@ -94,12 +106,16 @@ async def backtest(  # noqa: PLR0913
         portfolio_name = f"Backtest {','.join(symbols)}"
         portfolio = Portfolio(name=portfolio_name, client=client)
         await BinanceExchangeInfo.fetch_exchange_info(client=client)
-        [portfolio.add_symbol(symbol) for symbol in symbols]
+        client.preload_symbol_info()
+        portfolio.add_symbols(symbols)
         train_window = DataRequest(
-            interval, start_time, int(start_time + (end_time - start_time) * train_val_split)
+            interval,
+            start_time,
+            int(start_time + (end_time - start_time) * train_val_split),
+            dtype=precision,
         )
         train_data = await MarketDataFetcher.fetch_multiple_klines(
-            client, symbols=symbols, request=train_window
+            client, symbols=symbols, request=train_window, cache=cache
         )
         strategy = StatisticalArbitrage(
             interval, entry_threshold=entry_threshold, exit_threshold=exit_threshold
@@ -126,8 +142,11 @@ async def backtest(  # noqa: PLR0913
         cur_pt = int(len(train_data[symbols[0]]) * train_val_split)
         client.set_current_pointer(cur_pt)
 
-        for market_data in client.get_mock_data(strategy.get_lookback_request()):
-            await EventBus.publish(MarketDataEvent, data=MarketDataEvent(data=market_data))
+        market_data_events = (
+            MarketDataEvent(data=market_data)
+            for market_data in client.get_mock_data(strategy.get_lookback_request())
+        )
+        await EventBus.publish_batch(MarketDataEvent, market_data_events)
         ######## End of backtest session ########
     except Exception as e:
         if "client" in locals():
@@ -1,19 +1,20 @@
 import logging
 from typing import TYPE_CHECKING, Any, Literal
 
+import numpy as np
 from binance.async_client import AsyncClient
 
-from staarb.core.types import DataRequest, LookbackRequest
+from staarb.core.enums import OrderSide
+from staarb.core.types import DataRequest, LookbackRequest, LookbackWindow
 from staarb.data.exchange_info_fetcher import BinanceExchangeInfo
 from staarb.data.ohlc_fetcher import MarketDataFetcher
-from staarb.utils import date_to_milliseconds
+from staarb.utils import miliseconds_to_date
 
 if TYPE_CHECKING:
     from datetime import datetime
 
     import pandas as pd
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -25,13 +26,23 @@ class MockClient(AsyncClient):
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self.mock_data: dict[str, pd.Series] = {}  # Store mock data for backtesting
+        # Mock data for backtesting, as contiguous klines with shape (num_symbols, num_samples, num_columns)
+        self._klines: np.ndarray = np.empty((0, 0, 0))
+        self._symbol_index: dict[str, int] = {}
+        # Fill prices with slippage applied, with shape (num_symbols, num_samples)
+        self._exec_prices: np.ndarray = np.empty((0, 0))
+        self._time_stamps_ms: np.ndarray = np.empty(0, dtype=np.int64)
         self._current_pt = 0  # Pointer to the current data point
         self._len_data = 0
         self._commission_rate = 0.001
         self._slippage = 0.001
+        self._slip_factor = 1 - self._slippage
         self._asset_balance: dict[str, Any] = {}
-        self.time_stamps: list[datetime] = []
+        # Stringified margin account entries, refreshed only for assets changed since the last request
+        self._margin_assets: dict[str, dict[str, str]] = {}
+        self._dirty_assets: dict[str, None] = {}  # Ordered set of changed assets
+        # symbol -> (klines row, base asset, quote asset), resolved once per symbol
+        self._symbol_ctx: dict[str, tuple[int, str, str]] = {}
 
     @classmethod
     async def create(
@@ -40,12 +51,15 @@ class MockClient(AsyncClient):
         dreq: DataRequest | LookbackRequest,
         balance: dict[str, float],
         *args,
+        cache: bool = False,
         **kwargs,
     ) -> "MockClient":
         client = await super().create(*args, **kwargs)
-        client.mock_data = await MarketDataFetcher.fetch_multiple_klines(client, symbols, dreq)
-        client.time_stamps = next(iter(client.mock_data.values()), []).index
-        client.set_len_data(len(next(iter(client.mock_data.values()), [])))
+        mock_data = await MarketDataFetcher.fetch_multiple_klines(client, symbols, dreq, cache=cache)
+        first_data = next(iter(mock_data.values()), None)
+        if first_data is not None:
+            client.set_len_data(len(first_data))
+        client.set_klines(mock_data)
         for asset, free in balance.items():
             client.gain(asset, free)
         return client
@@ -56,16 +70,14 @@ class MockClient(AsyncClient):
         This simulates the account balance for backtesting.
         Auto repay borrowed amount if the asset is already borrowed.
         """
-        msg = f"Adding {amount} {asset} to mock balance."
-        logger.info(msg)
-        if asset not in self._asset_balance:
-            self._asset_balance[asset] = {"free": 0.0, "locked": 0.0, "borrowed": 0.0, "interest": 0.0}
-        if self._asset_balance[asset]["borrowed"] > 0:
-            loan = self._asset_balance[asset]["borrowed"]
+        logger.info("Adding %s %s to mock balance.", amount, asset)
+        balance = self._get_balance(asset)
+        loan = balance["borrowed"]
+        if loan > 0:
             # If there is a borrowed amount, repay it first
-            self._asset_balance[asset]["borrowed"] = max(0.0, loan - amount)
-            amount = max(0, amount - loan)
-        self._asset_balance[asset]["free"] += amount
+            balance["borrowed"] = max(0.0, loan - amount)
+            amount = max(0.0, amount - loan)
+        balance["free"] += amount
 
     def pay(self, asset: str, amount: float):
         """
@@ -73,13 +85,27 @@ class MockClient(AsyncClient):
         This simulates a payment or fee deduction in the mock environment.
         Auto borrow when balance is insufficient.
         """
-        msg = f"Paying {amount} {asset} from mock balance."
-        logger.info(msg)
-        if asset not in self._asset_balance:
-            self._asset_balance[asset] = {"free": 0.0, "locked": 0.0, "borrowed": 0.0, "interest": 0.0}
-        if self._asset_balance[asset]["free"] < amount:
-            self._asset_balance[asset]["borrowed"] += amount - self._asset_balance[asset]["free"]
-        self._asset_balance[asset]["free"] = max(0.0, self._asset_balance[asset]["free"] - amount)
+        logger.info("Paying %s %s from mock balance.", amount, asset)
+        balance = self._get_balance(asset)
+        free = balance["free"]
+        if free < amount:
+            balance["borrowed"] += amount - free
+            balance["free"] = 0.0
+        else:
+            balance["free"] = free - amount
+
+    def _get_balance(self, asset: str) -> dict[str, float]:
+        """Get the mutable balance record of an asset, creating an empty one on first use."""
+        self._dirty_assets[asset] = None
+        balance = self._asset_balance.get(asset)
+        if balance is None:
+            balance = self._asset_balance[asset] = {
+                "free": 0.0,
+                "locked": 0.0,
+                "borrowed": 0.0,
+                "interest": 0.0,
+            }
+        return balance
 
     def set_len_data(self, length: int):
         self._len_data = length
@@ -87,12 +113,54 @@ class MockClient(AsyncClient):
     def set_current_pointer(self, pt: int):
         self._current_pt = pt
 
+    def set_klines(self, mock_data: "dict[str, pd.DataFrame]"):
+        """
+        Pack the per-symbol klines into one contiguous array, indexed by symbol position.
+        This lets each backtest step hand out array views instead of slicing pandas objects,
+        and the frames themselves are not kept.
+        """
+        if not mock_data:
+            return
+        lengths = {len(data) for data in mock_data.values()}
+        if len(lengths) > 1:
+            msg = f"Mock data must have the same length for every symbol, got lengths {sorted(lengths)}."
+            raise ValueError(msg)
+        self._symbol_index = {symbol: idx for idx, symbol in enumerate(mock_data)}
+        klines = np.stack([data.to_numpy() for data in mock_data.values()])
+        # Keep the floating precision the klines were fetched with
+        self._klines = klines if np.issubdtype(klines.dtype, np.floating) else klines.astype(np.float64)
+        # Orders fill at the first column, so apply the slippage to the whole series once
+        self._exec_prices = self._klines[:, :, 0].astype(np.float64) * self._slip_factor
+        # The index holds epoch milliseconds as fetched, or datetimes
+        time_stamps = next(iter(mock_data.values())).index
+        self._time_stamps_ms = np.asarray(time_stamps, dtype="datetime64[ms]").astype(np.int64)
+
+    def preload_symbol_info(self):
+        """
+        Cache the order context of every mock symbol from the fetched exchange info.
+        Symbols that are not preloaded are looked up on their first order instead.
+        """
+        for symbol in self._symbol_index:
+            self._load_symbol_ctx(symbol)
+
+    def _load_symbol_ctx(self, symbol: str) -> tuple[int, str, str]:
+        if symbol not in self._symbol_index:
+            msg = f"Symbol {symbol} not found in mock data."
+            raise ValueError(msg)
+        symbol_info = BinanceExchangeInfo.get_symbol_info(symbol)
+        ctx = self._symbol_ctx[symbol] = (
+            self._symbol_index[symbol],
+            symbol_info.base_asset,
+            symbol_info.quote_asset,
+        )
+        return ctx
+
     def get_mock_data(self, dreq: LookbackRequest):
         """
         Get mock data for the given lookback request.
         This simulates fetching historical data without making API calls.
         """
-        if not self.mock_data:
+        if not self._symbol_index:
             msg = "Mock data is not set. Please create the client with mock data first."
             raise ValueError(msg)
         if self._current_pt < dreq.limit:
@@ -101,66 +169,67 @@ class MockClient(AsyncClient):
 
         while self._current_pt < self._len_data:
             self._current_pt += 1
-            yield {
-                symbol: data[self._current_pt - dreq.limit : self._current_pt]
-                for symbol, data in self.mock_data.items()
-            }
+            yield LookbackWindow(
+                self._klines, self._symbol_index, self._current_pt - dreq.limit, self._current_pt
+            )
 
-    def get_current_time(self):
+    def get_current_time(self) -> "datetime":
         """
         Get the current mock time.
         This simulates the current time in the mock environment.
         """
-        return self.time_stamps[self._current_pt - 1]
+        return miliseconds_to_date(int(self._time_stamps_ms[self._current_pt - 1]))
 
     async def get_margin_account(self, **_):
         """
         Mock method to simulate getting asset balance.
         This does not make an actual API call but returns the mock asset balance.
         """
-        user_assets = []
-        for ast, balance in self._asset_balance.items():
-            user_assets.append(
-                {
-                    "asset": ast,
-                    "free": str(balance["free"]),
-                    "locked": str(balance["locked"]),
-                    "borrowed": str(balance["borrowed"]),
-                    "interest": str(balance["interest"]),
-                }
-            )
-        return {"userAssets": user_assets}
+        for ast in self._dirty_assets:
+            balance = self._asset_balance[ast]
+            self._margin_assets[ast] = {
+                "asset": ast,
+                "free": str(balance["free"]),
+                "locked": str(balance["locked"]),
+                "borrowed": str(balance["borrowed"]),
+                "interest": str(balance["interest"]),
+            }
+        self._dirty_assets.clear()
+        return {"userAssets": list(self._margin_assets.values())}
 
-    async def create_margin_order(self, symbol: str, quantity: float, side: Literal["BUY", "SELL"], **_):
+    async def create_margin_order(
+        self, symbol: str, quantity: float, side: OrderSide | Literal["BUY", "SELL"], **_
+    ):
         """
         Mock method to simulate creating a margin order.
         This does not make an actual API call but simulates the response.
         """
-        if symbol not in self.mock_data:
-            msg = f"Symbol {symbol} not found in mock data."
-            raise ValueError(msg)
-
-        symbol_info = BinanceExchangeInfo.get_symbol_info(symbol)
-        price = self.mock_data[symbol].to_numpy()[self._current_pt - 1, 0] * (1 - self._slippage)
-
-        commission_asset = symbol_info.base_asset if side == "BUY" else symbol_info.quote_asset
-        commission = (
-            quantity * self._commission_rate if side == "BUY" else price * quantity * self._commission_rate
-        )
-        if side == "BUY":
-            self.pay(symbol_info.quote_asset, price * quantity)
-            self.gain(symbol_info.base_asset, quantity)
-            self.pay(commission_asset, commission)
+        # The order executor passes the enum member, so the identity check usually settles it
+        is_buy = side is OrderSide.BUY or side == "BUY"
+        ctx = self._symbol_ctx.get(symbol)
+        if ctx is None:
+            ctx = self._load_symbol_ctx(symbol)
+        row, base_asset, quote_asset = ctx
+        price = float(self._exec_prices[row, self._current_pt - 1])
+        notional = price * quantity
+
+        if is_buy:
+            commission_asset = base_asset
+            commission = quantity * self._commission_rate
+            self.pay(quote_asset, notional)
+            self.gain(base_asset, quantity)
         else:
-            self.pay(symbol_info.base_asset, quantity)
-            self.gain(symbol_info.quote_asset, price * quantity)
-            self.pay(commission_asset, commission)
+            commission_asset = quote_asset
+            commission = notional * self._commission_rate
+            self.pay(base_asset, quantity)
+            self.gain(quote_asset, notional)
+        self.pay(commission_asset, commission)
         # Simulate a successful order creation response
         return {
             "symbol": symbol,
             "orderId": 123456789,
             "clientOrderId": "mock_client_order_id",
-            "transactTime": date_to_milliseconds(self.get_current_time()),
+            "transactTime": int(self._time_stamps_ms[self._current_pt - 1]),
             "price": None,
             "origQty": quantity,
             "executedQty": quantity,
@@ -1,13 +1,13 @@
 import logging
-from asyncio import create_task, gather
-from collections.abc import Callable
+from asyncio import gather
+from collections.abc import Callable, Iterable
+from inspect import iscoroutinefunction
 from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
     from staarb.core.bus.events import BaseEvent
 
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -17,7 +17,8 @@ class EventBus:
     and the publishing of events to those handlers.
     """
 
-    _handlers: ClassVar[dict[type["BaseEvent"], list[Callable]]] = {}
+    # Handlers are kept in tuples that are replaced on subscription, so publishing never copies them
+    _handlers: ClassVar[dict[type["BaseEvent"], tuple[Callable, ...]]] = {}
 
     @classmethod
     def subscribe(cls, event_type: type["BaseEvent"], handler: Callable) -> None:
@@ -26,17 +27,44 @@ class EventBus:
 
         The handler will be called with the event data when the event is published.
         """
-        if event_type not in cls._handlers:
-            cls._handlers[event_type] = []
-        cls._handlers[event_type].append(handler)
+        cls._handlers[event_type] = (*cls._handlers.get(event_type, ()), handler)
 
     @classmethod
     async def publish(cls, event_type: Any, data=None) -> None:
         """
         Publish an event to all registered handlers for that event type.
         """
-        if event_type in cls._handlers:
-            msg = f"Publishing event {event_type.__name__} with data: {data}"
-            logger.info(msg)
-            tasks = [create_task(handler(data)) for handler in cls._handlers[event_type]]
-            await gather(*tasks)
+        handlers = cls._handlers.get(event_type)
+        if not handlers:
+            return
+        logger.debug("Publishing event %s with data: %s", event_type.__name__, data)
+        if len(handlers) == 1:
+            await handlers[0](data)
+        else:
+            await gather(*[handler(data) for handler in handlers])
+
+    @classmethod
+    async def publish_batch(cls, event_type: Any, events: Iterable) -> None:
+        """
+        Publish a sequence of events to all registered handlers, one event after another.
+
+        Handlers are resolved once for the whole batch. When none of them is a coroutine function
+        they are called synchronously; otherwise each event is dispatched with a single gather so
+        handlers of the same event still run concurrently, as with `publish`.
+        """
+        handlers = cls._handlers.get(event_type, ())
+        if not handlers:
+            return
+        logger.info("Publishing batch of %s events to %d handlers", event_type.__name__, len(handlers))
+        if not any(iscoroutinefunction(handler) for handler in handlers):
+            for data in events:
+                for handler in handlers:
+                    handler(data)
+            return
+        if len(handlers) == 1:
+            handler = handlers[0]
+            for data in events:
+                await handler(data)
+            return
+        for data in events:
+            await gather(*[handler(data) for handler in handlers])
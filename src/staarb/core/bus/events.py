@@ -1,9 +1,10 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
-import pytz
 
 from staarb.core.enums import PositionDirection, SessionType, StrategyDecision
 from staarb.core.types import HedgeRatio, Order, Transaction
@@ -12,7 +13,7 @@ if TYPE_CHECKING:
     from staarb.portfolio.position import Position
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BaseEvent:
     timestamp: datetime | None = None
     """Base class for all events in the event bus."""
@@ -20,10 +21,15 @@ class BaseEvent:
     def __post_init__(self):
         if self.timestamp is None:
             # Set the timestamp to the current UTC time if not provided
-            self.timestamp = datetime.now(tz=pytz.UTC)
+            self.timestamp = datetime.now(tz=UTC)
 
 
-@dataclass(kw_only=True)
+def _format_session_time(t: datetime) -> str:
+    """Format a time as %Y%m%d_%H%M%S without going through strftime's format parsing."""
+    return f"{t.year:04d}{t.month:02d}{t.day:02d}_{t.hour:02d}{t.minute:02d}{t.second:02d}"
+
+
+@dataclass(kw_only=True, slots=True)
 class SessionEvent(BaseEvent):
     session_type: SessionType
     start_time: datetime
@@ -32,18 +38,19 @@ class SessionEvent(BaseEvent):
     """Event for session start or end, identified by a session ID."""
 
     def __post_init__(self):
-        super().__post_init__()
+        # Zero-argument super() does not work in slotted dataclasses, which are rebuilt as new classes
+        BaseEvent.__post_init__(self)
         if self.session_id is None:
             # Generate a session ID if not provided
-            start_time_str = self.start_time.strftime("%Y%m%d_%H%M%S")
-            timestamp_str = self.timestamp.strftime("%Y%m%d_%H%M%S")
+            start_time_str = _format_session_time(self.start_time)
+            timestamp_str = _format_session_time(self.timestamp)
             self.session_id = f"{self.session_type.value}_{start_time_str}_{timestamp_str}"
 
     def __repr__(self):
         return f"SessionEvent(timestamp={self.timestamp}, session_type={self.session_type})"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PositionEvent(BaseEvent):
     position: "Position"
     """Event for position updates, such as entry or exit."""
@@ -57,9 +64,9 @@ class PositionEvent(BaseEvent):
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class MarketDataEvent(BaseEvent):
-    data: dict[str, pd.Series]
+    data: Mapping[str, pd.DataFrame | np.ndarray]
     """Event for market data updates, such as price changes."""
 
     def __repr__(self):
@@ -72,21 +79,19 @@ class MarketDataEvent(BaseEvent):
         return f"MarketDataEvent(timestamp={self.timestamp}, data=empty)"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SignalEvent(BaseEvent):
     signal: StrategyDecision
     hedge_ratio: HedgeRatio
     prices: dict[str, float]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TransactionClosedEvent(BaseEvent):
     transaction: Transaction
     position_direction: PositionDirection
-    timestamp: datetime | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class OrderCreatedEvent(BaseEvent):
     orders: list[Order]
-    timestamp: datetime | None = None
@@ -19,7 +19,6 @@ def setup_backtest_subscribers(
     storage: TradingStorage | None = None,
 ):
     EventBus.subscribe(MarketDataEvent, strategy.on_market_data)
-    EventBus.subscribe(MarketDataEvent, portfolio.update_account_size)
     EventBus.subscribe(SignalEvent, portfolio.publish_orders)
     EventBus.subscribe(OrderCreatedEvent, executor.execute_order)
     EventBus.subscribe(TransactionClosedEvent, portfolio.update_position)
@@ -0,0 +1,38 @@
+"""
+Optional Numba support.
+
+Numba is an optional accelerator: when it is not installed, ``njit`` degrades to a no-op
+decorator and ``NUMBA_AVAILABLE`` is False so callers can select a vectorized NumPy path instead
+of running a scalar loop in the interpreter.
+
+Kernels compiled with ``cache=True`` are written under the staarb cache directory unless
+``NUMBA_CACHE_DIR`` is set, so the cache also works when the package is installed read-only.
+Only numba's own config is changed; the process environment is left untouched.
+"""
+
+from staarb.utils import get_cache_dir
+
+try:
+    from numba import config as numba_config
+    from numba import njit
+
+    # Must be set before the first cached kernel is decorated, which is when numba locates its cache
+    if not numba_config.CACHE_DIR:
+        numba_config.CACHE_DIR = str(get_cache_dir() / "numba")
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]  # noqa: ARG001
+        """No-op stand-in for ``numba.njit`` supporting both bare and parametrized use."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit"]
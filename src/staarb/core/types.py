@@ -1,28 +1,40 @@
 import uuid
-from dataclasses import dataclass
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
 from datetime import datetime
 
+import numpy as np
+
 from staarb.core.enums import OrderSide
 
 
 @dataclass
 class LotSizeFilter:
-    min_qty: str
-    max_qty: str
-    step_size: str
+    min_qty: float
+    max_qty: float
+    step_size: float
 
 
 @dataclass
 class PriceFilter:
-    min_price: str
-    max_price: str
-    tick_size: str
+    min_price: float
+    max_price: float
+    tick_size: float
 
 
 @dataclass
 class NotionalFitter:
-    min_notional: str
-    max_notional: str
+    min_notional: float
+    max_notional: float
+
+
+# filterType -> (Filters attribute, filter class, exchange keys in constructor order).
+# Values are parsed to float once here instead of on every order.
+_FILTER_TABLE: dict[str, tuple[str, type, tuple[str, ...]]] = {
+    "LOT_SIZE": ("lot_size", LotSizeFilter, ("minQty", "maxQty", "stepSize")),
+    "PRICE_FILTER": ("price", PriceFilter, ("minPrice", "maxPrice", "tickSize")),
+    "NOTIONAL": ("notional", NotionalFitter, ("minNotional", "maxNotional")),
+}
 
 
 @dataclass
@@ -33,22 +45,10 @@ class Filters:
 
     def __init__(self, *filters):
         for filter_config in filters:
-            if filter_config["filterType"] == "LOT_SIZE":
-                self.lot_size = LotSizeFilter(
-                    min_qty=filter_config["minQty"],
-                    max_qty=filter_config["maxQty"],
-                    step_size=filter_config["stepSize"],
-                )
-            elif filter_config["filterType"] == "PRICE_FILTER":
-                self.price = PriceFilter(
-                    min_price=filter_config["minPrice"],
-                    max_price=filter_config["maxPrice"],
-                    tick_size=filter_config["tickSize"],
-                )
-            elif filter_config["filterType"] == "NOTIONAL":
-                self.notional = NotionalFitter(
-                    min_notional=filter_config["minNotional"], max_notional=filter_config["maxNotional"]
-                )
+            entry = _FILTER_TABLE.get(filter_config["filterType"])
+            if entry is not None:
+                attr, filter_cls, keys = entry
+                setattr(self, attr, filter_cls(*[float(filter_config[key]) for key in keys]))
 
 
 @dataclass
@@ -67,8 +67,12 @@ class Symbol:
         self.base_asset_precision = kwargs.get("baseAssetPrecision")
         self.quote_asset_precision = kwargs.get("quoteAssetPrecision")
         self.filters = Filters(*kwargs.get("filters"))
+        self._hash = hash(self.name)
 
     def __eq__(self, value):
+        # Symbols are shared through BinanceExchangeInfo.symbols, so most comparisons are identical objects
+        if self is value:
+            return True
         if not isinstance(value, Symbol):
             msg = f"Cannot compare {self.__class__.__name__} with {value.__class__.__name__}"
             raise TypeError(msg)
@@ -81,7 +85,7 @@ class Symbol:
         return f"Symbol(name={self.name}, ...)"
 
     def __hash__(self):
-        return hash(self.name)
+        return self._hash
 
 
 @dataclass
@@ -90,6 +94,7 @@ class DataRequest:
     start: int
     end: int
     columns: list[str] | None = None
+    dtype: str = "float64"  # e.g. "float32" to halve the memory of the klines
 
     def __post_init__(self):
         if self.columns is None:
@@ -101,12 +106,40 @@ class LookbackRequest:
     interval: str
     limit: int
     columns: list[str] | None = None
+    dtype: str = "float64"  # e.g. "float32" to halve the memory of the klines
 
     def __post_init__(self):
         if self.columns is None:
             self.columns = ["close"]
 
 
+@dataclass(slots=True)
+class LookbackWindow(Mapping[str, np.ndarray]):
+    """
+    Read-only mapping from symbol to its trailing klines, without building per-symbol slices upfront.
+    Each value is a view with shape (num_samples, num_columns) over the shared klines array.
+    """
+
+    klines: np.ndarray  # (num_symbols, total_samples, num_columns)
+    symbol_index: Mapping[str, int]
+    start: int
+    end: int
+
+    def __getitem__(self, symbol: str) -> np.ndarray:
+        return self.klines[self.symbol_index[symbol], self.start : self.end]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.symbol_index)
+
+    def __len__(self) -> int:
+        return len(self.symbol_index)
+
+    def to_array(self) -> np.ndarray:
+        """Return the window as a (num_symbols * num_columns, num_samples) array, in symbol order."""
+        window = self.klines[:, self.start : self.end]
+        return window.transpose(0, 2, 1).reshape(-1, self.end - self.start)
+
+
 KLINE_COLUMNS = [
     "open_time",
     "open",
@@ -135,13 +168,23 @@ HedgeRatio = list[SingleHedgeRatio]
 class Fill:
     """A class to represent a trade fill."""
 
+    __slots__ = (
+        "base_quantity",
+        "commission",
+        "commission_asset",
+        "price",
+        "quantity",
+        "quote_quantity",
+        "symbol",
+    )
+
     symbol: Symbol
     price: float
     quantity: float
     commission: float
     commission_asset: str
-    base_quantity: float
-    quote_quantity: float
+    quote_quantity: float  # net of commission paid in the quote asset
+    base_quantity: float  # net of commission paid in the base asset
 
     def __init__(
         self, symbol: Symbol, price: float, quantity: float, commission: float, commission_asset: str
@@ -151,18 +194,10 @@ class Fill:
         self.quantity = quantity
         self.commission = commission
         self.commission_asset = commission_asset
-        self.base_quantity = self._set_base_quantity()
-        self.quote_quantity = self._set_quote_quantity()
-
-    def _set_quote_quantity(self):
-        if self.symbol.quote_asset == self.commission_asset:
-            return self.price * self.quantity - self.commission
-        return self.price * self.quantity
-
-    def _set_base_quantity(self):
-        if self.symbol.base_asset == self.commission_asset:
-            return self.quantity - self.commission
-        return self.quantity
+        # Net quantities are computed once here so they can live in slots
+        notional = price * quantity
+        self.quote_quantity = notional - commission if symbol.quote_asset == commission_asset else notional
+        self.base_quantity = quantity - commission if symbol.base_asset == commission_asset else quantity
 
 
 @dataclass
@@ -182,6 +217,7 @@ class Transaction:
     fills: list[Fill]
     transact_time: datetime
     id: str | None = None
+    _fill_totals: tuple[float, float] | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if not self.fills:
@@ -196,6 +232,24 @@ class Transaction:
         if self.id is None:
             self.id = str(uuid.uuid4())
 
+    def fill_totals(self) -> tuple[float, float]:
+        """
+        Sum the base and quote quantities of all fills in a single pass.
+
+        The result is cached, as the fills of a transaction do not change once it is closed.
+
+        Returns:
+            tuple[float, float]: The total base quantity and the total quote quantity.
+
+        """
+        if self._fill_totals is None:
+            base_quantity = quote_quantity = 0.0
+            for fill in self.fills:
+                base_quantity += fill.base_quantity
+                quote_quantity += fill.quote_quantity
+            self._fill_totals = (base_quantity, quote_quantity)
+        return self._fill_totals
+
     def avg_fill_price(self):
         """
         Calculate the average fill price of the transaction.
@@ -206,6 +260,5 @@ class Transaction:
             float: The average fill price.
 
         """
-        return sum(fill.quote_quantity for fill in self.fills) / sum(
-            fill.base_quantity for fill in self.fills
-        )
+        base_quantity, quote_quantity = self.fill_totals()
+        return quote_quantity / base_quantity
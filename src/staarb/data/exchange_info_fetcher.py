@@ -1,18 +1,75 @@
-from typing import ClassVar
+import json
+import logging
+import time
+from collections.abc import Callable
+from typing import Any, ClassVar
 
 from binance.async_client import AsyncClient
 
 from staarb.core.types import Symbol
+from staarb.utils import get_cache_dir
+
+_json_loads: Callable[[bytes], Any]
+_json_dumps: Callable[[Any], bytes]
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson is optional; the stdlib module handles the same payload more slowly
+
+    def _stdlib_json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+    _json_dumps = _stdlib_json_dumps
+
+
+logger = logging.getLogger(__name__)
+
+# Exchange info changes at most daily, so a cached copy is reused for this many seconds
+EXCHANGE_INFO_TTL = 24 * 60 * 60
 
 
 class BinanceExchangeInfo:
     symbols: ClassVar[dict[str, Symbol]] = {}
+    cache_file_name: ClassVar[str] = "exchange_info.json"
 
     @classmethod
-    async def fetch_exchange_info(cls, client: AsyncClient) -> None:
-        symbols_info = (await client.get_exchange_info())["symbols"]
+    async def fetch_exchange_info(cls, client: AsyncClient, ttl: float = EXCHANGE_INFO_TTL) -> None:
+        """
+        Load the exchange symbols, reusing the on-disk copy while it is younger than `ttl` seconds.
+        A `ttl` of 0 always queries the exchange.
+        """
+        symbols_info = cls._read_cache(ttl)
+        if symbols_info is None:
+            symbols_info = (await client.get_exchange_info())["symbols"]
+            cls._write_cache(symbols_info)
         cls.symbols = {symbol["symbol"]: Symbol(**symbol) for symbol in symbols_info}
 
+    @classmethod
+    def _read_cache(cls, ttl: float) -> list[dict[str, Any]] | None:
+        cache_file = get_cache_dir() / cls.cache_file_name
+        try:
+            if time.time() - cache_file.stat().st_mtime >= ttl:
+                return None
+            return _json_loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def _write_cache(cls, symbols_info: list[dict[str, Any]]) -> None:
+        cache_file = get_cache_dir() / cls.cache_file_name
+        tmp_file = cache_file.with_suffix(".tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_bytes(_json_dumps(symbols_info))
+            tmp_file.replace(cache_file)
+        except OSError as e:
+            msg = f"Could not cache exchange info to {cache_file}: {e}"
+            logger.warning(msg)
+
     @classmethod
     def get_symbol_info(cls, symbol: str) -> Symbol:
         if symbol not in cls.symbols:
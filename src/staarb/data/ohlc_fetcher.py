@@ -1,9 +1,22 @@
-from asyncio import create_task, gather
+import hashlib
+import logging
+import time
+from asyncio import Semaphore, TaskGroup
+from pathlib import Path
+from typing import ClassVar
 
+import numpy as np
 import pandas as pd
 from binance.async_client import AsyncClient
+from binance.helpers import interval_to_milliseconds
 
 from staarb.core.types import KLINE_COLUMNS, DataRequest, LookbackRequest
+from staarb.utils import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on simultaneous kline requests; each one may page through several API calls
+MAX_CONCURRENT_REQUESTS = 10
 
 
 class MarketDataFetcher:
@@ -11,11 +24,37 @@ class MarketDataFetcher:
     MarketDataFetcher is a class that fetches market data from the Binance API.
     """
 
+    cache_dir_name: ClassVar[str] = "klines"
+
     @classmethod
-    async def fetch_klines(cls, client: AsyncClient, symbol: str, request: DataRequest | LookbackRequest):
+    async def fetch_klines(
+        cls,
+        client: AsyncClient,
+        symbol: str,
+        request: DataRequest | LookbackRequest,
+        *,
+        cache: bool = False,
+    ):
         """
         Fetch klines (candlestick data) for a given symbol and request parameters.
+
+        With `cache`, klines of a fixed window that has already closed are kept on disk and reused
+        by later fetches of the same window. Lookback requests always query the exchange.
         """
+        cache_file = cls._cache_file(symbol, request) if cache else None
+        if cache_file is not None:
+            cached_klines = cls._read_cache(cache_file, request)
+            if cached_klines is not None:
+                return cached_klines
+        klines = await cls._fetch_klines(client, symbol, request)
+        if cache_file is not None:
+            cls._write_cache(cache_file, klines)
+        return klines
+
+    @classmethod
+    async def _fetch_klines(
+        cls, client: AsyncClient, symbol: str, request: DataRequest | LookbackRequest
+    ) -> pd.DataFrame:
         if isinstance(request, DataRequest):
             klines = await client.get_historical_klines(
                 symbol,
@@ -33,17 +72,85 @@ class MarketDataFetcher:
             msg = f"Invalid request type: {type(request)}"
             raise TypeError(msg)
         klines = pd.DataFrame(klines, columns=KLINE_COLUMNS, dtype=float)
-        klines["open_time"] = pd.to_datetime(klines["open_time"], unit="ms")
+        # Keep Binance's native millisecond timestamps; they are converted to datetimes only on demand
+        klines["open_time"] = klines["open_time"].astype("int64")
 
-        return klines.set_index("open_time")[request.columns]
+        return klines.set_index("open_time")[request.columns].astype(request.dtype, copy=False)
+
+    @classmethod
+    def _cache_file(cls, symbol: str, request: DataRequest | LookbackRequest) -> Path | None:
+        """Get the cache file of a request, or None if its klines may still change."""
+        if not isinstance(request, DataRequest):
+            return None
+        # The last kline is only final once its interval has elapsed
+        interval_ms = interval_to_milliseconds(request.interval)
+        if interval_ms is None or request.end + interval_ms > time.time() * 1000:
+            return None
+        key = "|".join(
+            (
+                symbol,
+                request.interval,
+                str(request.start),
+                str(request.end),
+                ",".join(request.columns or ()),  # None only before __post_init__ fills the default
+                request.dtype,
+            )
+        )
+        digest = hashlib.sha1(key.encode(), usedforsecurity=False).hexdigest()
+        return get_cache_dir() / cls.cache_dir_name / f"{digest}.npz"
+
+    @classmethod
+    def _read_cache(cls, cache_file: Path, request: DataRequest | LookbackRequest) -> pd.DataFrame | None:
+        try:
+            with np.load(cache_file, allow_pickle=False) as cached:
+                index, values = cached["open_time"], cached["values"]
+        except (OSError, ValueError, KeyError):
+            return None
+        return pd.DataFrame(
+            values,
+            index=pd.Index(index, name="open_time"),
+            columns=request.columns,
+        )
+
+    @classmethod
+    def _write_cache(cls, cache_file: Path, klines: pd.DataFrame) -> None:
+        tmp_file = cache_file.with_suffix(".tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_file.open("wb") as f:
+                np.savez(f, open_time=klines.index.to_numpy(), values=klines.to_numpy())
+            tmp_file.replace(cache_file)
+        except OSError as e:
+            msg = f"Could not cache klines to {cache_file}: {e}"
+            logger.warning(msg)
 
     @classmethod
     async def fetch_multiple_klines(
-        cls, client: AsyncClient, symbols: list[str], request: DataRequest | LookbackRequest
+        cls,
+        client: AsyncClient,
+        symbols: list[str],
+        request: DataRequest | LookbackRequest,
+        concurrency: int = MAX_CONCURRENT_REQUESTS,
+        *,
+        cache: bool = False,
     ):
         """
         Fetch klines (candlestick data) for the given list of symbols and request parameters.
+
+        Symbols are fetched concurrently over the client's shared HTTP session, with at most
+        `concurrency` requests in flight to stay clear of the exchange's rate limits; if one fetch
+        fails, the remaining ones are cancelled and its exception is raised. See `fetch_klines`
+        for `cache`.
         """
-        tasks = [create_task(cls.fetch_klines(client, symbol, request)) for symbol in symbols]
-        results = await gather(*tasks)
-        return dict(zip(symbols, results, strict=False))
+        semaphore = Semaphore(concurrency)
+
+        async def fetch(symbol: str):
+            async with semaphore:
+                return await cls.fetch_klines(client, symbol, request, cache=cache)
+
+        try:
+            async with TaskGroup() as tg:
+                tasks = [tg.create_task(fetch(symbol)) for symbol in symbols]
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0] from eg
+        return {symbol: task.result() for symbol, task in zip(symbols, tasks, strict=True)}
@@ -5,15 +5,15 @@ from sqlmodel import Field, Relationship, SQLModel
 from staarb.core.enums import SessionType
 
 
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
 class TimestampedModel(SQLModel):
     """Base model with timestamp fields."""
 
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC), index=True)
-    updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(UTC),
-        index=True,
-        sa_column_kwargs={"onupdate": lambda: datetime.now(UTC)},
-    )
+    created_at: datetime = Field(default_factory=_utcnow, index=True)
+    updated_at: datetime = Field(default_factory=_utcnow, index=True, sa_column_kwargs={"onupdate": _utcnow})
 
 
 class TradingSession(TimestampedModel, table=True):
@@ -1,9 +1,36 @@
+import asyncio
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event, insert, make_url
+from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine
 
 from staarb.core.bus.events import PositionEvent, SessionEvent
 from staarb.core.types import Transaction as TransactionType
 from staarb.persistence.models import Fill, Order, Position, TradingSession, Transaction
 
+if TYPE_CHECKING:
+    from staarb.portfolio.position import Position as PositionType
+
+# Write-ahead logging lets readers (e.g. analysis notebooks) coexist with the writer, and
+# synchronous=NORMAL only fsyncs at checkpoints instead of on every commit.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+# Seconds to wait for a lock held by another process (e.g. a dashboard reading the database)
+SQLITE_BUSY_TIMEOUT = 30
+
+
+def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 
 class TradingStorage:
     """
@@ -16,8 +43,20 @@ class TradingStorage:
 
         :param storage_path: The path where trading data will be stored.
         """
-        self.engine = create_engine(database_url)
+        if make_url(database_url).get_backend_name() == "sqlite":
+            # All sessions share one connection, so the file is opened and configured only once
+            self.engine = create_engine(
+                database_url,
+                connect_args={"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT},
+                poolclass=StaticPool,
+            )
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
+        else:
+            self.engine = create_engine(database_url)
         SQLModel.metadata.create_all(self.engine)
+        # Database calls block, so they run in a worker thread; the lock keeps one writer at a time,
+        # which the shared SQLite connection requires
+        self._write_lock = asyncio.Lock()
 
     async def save_session(self, session: SessionEvent) -> None:
         """
@@ -32,46 +71,64 @@ class TradingStorage:
             start_time=session.start_time,
             end_time=session.end_time,
         )
-        with Session(self.engine) as db_session:
+        async with self._write_lock:
+            await asyncio.to_thread(self._write_session, persist_session)
+        self.session = persist_session
+
+    def _write_session(self, persist_session: TradingSession) -> None:
+        # Every column is set client-side, so the committed object is kept as is instead of reloaded
+        with Session(self.engine, expire_on_commit=False) as db_session:
             db_session.add(persist_session)
             db_session.commit()
-            db_session.refresh(persist_session)
-        self.session = persist_session
 
-    def _add_transaction(self, transaction: TransactionType, position: Position, db_session: Session) -> None:
+    def _add_transactions(
+        self, transactions: Sequence[TransactionType], position_id: str, db_session: Session
+    ) -> None:
         """
-        Saves a transaction to the storage.
+        Saves transactions, with their orders and fills, to the storage.
 
-        :param transaction: The transaction to save.
+        Each table gets a single multi-row insert instead of one ORM object per row.
+
+        :param transactions: The transactions to save.
+        :param position_id: The ID of the position the transactions belong to.
         """
-        # Implementation for saving the transaction
-        saved_transaction = Transaction(
-            id=transaction.id, timestamp=transaction.transact_time, position=position
-        )
-        order = Order(
-            symbol=transaction.order.symbol.name,
-            quantity=transaction.order.quantity,
-            side=transaction.order.side.value,
-            price=transaction.order.price,
-            side_effect=transaction.order.side_effect,
-            type=transaction.order.type,
-            time_in_force=transaction.order.time_in_force,
-            transaction=saved_transaction,
-        )
-        transaction_fills = [
-            Fill(
-                symbol=fill.symbol.name,
-                price=fill.price,
-                quantity=fill.quantity,
-                commission=fill.commission,
-                commission_asset=fill.commission_asset,
-                transaction=saved_transaction,
+        if not transactions:
+            return
+        transaction_rows: list[dict[str, Any]] = []
+        order_rows: list[dict[str, Any]] = []
+        fill_rows: list[dict[str, Any]] = []
+        for transaction in transactions:
+            order = transaction.order
+            transaction_rows.append(
+                {"id": transaction.id, "timestamp": transaction.transact_time, "position_id": position_id}
+            )
+            order_rows.append(
+                {
+                    "symbol": order.symbol.name,
+                    "quantity": order.quantity,
+                    "side": order.side.value,
+                    "price": order.price,
+                    "side_effect": order.side_effect,
+                    "type": order.type,
+                    "time_in_force": order.time_in_force,
+                    "transaction_id": transaction.id,
+                }
             )
-            for fill in transaction.fills
-        ]
-        db_session.add(saved_transaction)
-        db_session.add(order)
-        db_session.add_all(transaction_fills)
+            fill_rows.extend(
+                {
+                    "symbol": fill.symbol.name,
+                    "price": fill.price,
+                    "quantity": fill.quantity,
+                    "commission": fill.commission,
+                    "commission_asset": fill.commission_asset,
+                    "transaction_id": transaction.id,
+                }
+                for fill in transaction.fills
+            )
+        connection = db_session.connection()
+        connection.execute(insert(Transaction), transaction_rows)
+        connection.execute(insert(Order), order_rows)
+        connection.execute(insert(Fill), fill_rows)
 
     async def save_position(self, position_event: PositionEvent) -> None:
         """
@@ -79,7 +136,10 @@ class TradingStorage:
 
         :param position_event: The position event containing the position to save.
         """
-        position = position_event.position
+        async with self._write_lock:
+            await asyncio.to_thread(self._write_position, position_event.position)
+
+    def _write_position(self, position: "PositionType") -> None:
         with Session(self.engine) as db_session:
             existing_position = db_session.get(Position, position.position_id)
             if existing_position:
@@ -108,7 +168,9 @@ class TradingStorage:
                 )
                 db_session.add(persist_position)
             unsaved_transactions = position.get_unsaved_transactions()
-            for transaction in unsaved_transactions:
-                self._add_transaction(transaction, persist_position, db_session)
+            if unsaved_transactions:
+                # The position row must be written before its transactions reference it
+                db_session.flush()
+                self._add_transactions(unsaved_transactions, persist_position.id, db_session)
             position.mark_transactions_as_saved(len(unsaved_transactions))
             db_session.commit()
@@ -1,12 +1,14 @@
 import asyncio
 import logging
+from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from binance.async_client import AsyncClient
 from binance.exceptions import BinanceOrderMinAmountException, BinanceOrderMinTotalException
 
 from staarb.core.bus.event_bus import EventBus
-from staarb.core.bus.events import OrderCreatedEvent, SignalEvent, TransactionClosedEvent
+from staarb.core.bus.events import OrderCreatedEvent, PositionEvent, SignalEvent, TransactionClosedEvent
 from staarb.core.constants import EPS
 from staarb.core.enums import OrderSide, StrategyDecision
 from staarb.core.types import Order, Symbol
@@ -14,15 +16,25 @@ from staarb.data.exchange_info_fetcher import BinanceExchangeInfo
 from staarb.portfolio.position import Position
 from staarb.utils import round_step_size
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# (hedge ratio is positive, signal) -> side of the order for that leg
+_ORDER_SIDES = {
+    (True, StrategyDecision.LONG): OrderSide.BUY,
+    (True, StrategyDecision.SHORT): OrderSide.SELL,
+    (False, StrategyDecision.LONG): OrderSide.SELL,
+    (False, StrategyDecision.SHORT): OrderSide.BUY,
+}
+
 
 @dataclass
 class PortfolioConfig:
     account_size: float | None = None
     leverage: float = 3.8
     quote: str = "USDC"
+    # When set, position updates are buffered for a background publisher instead of being published
+    # inline, so slow subscribers (e.g. storage) do not hold up transaction handling
+    position_queue_size: int | None = None
 
 
 class Portfolio:
@@ -37,12 +49,17 @@ class Portfolio:
         self.name = name
         self.client = client
         self.account_size = config.account_size
-        self._account_updated = asyncio.Event()
+        # Balances only change when orders fill, so the account is refetched on the next sizing after a fill
+        self._account_stale = True
         self.quote = config.quote
         self.leverage = config.leverage
         self.symbols: set[Symbol] = set()  # Set of symbols in the portfolio
         self.open_positions: dict[Symbol, Position] = {}  # Single open position per symbol
-        self.closed_positions: dict[Symbol, list[Position]] = {}  # Closed positions
+        self.closed_positions: defaultdict[Symbol, list[Position]] = defaultdict(list)  # Closed positions
+        self._position_events: asyncio.Queue[PositionEvent] | None = (
+            asyncio.Queue(maxsize=config.position_queue_size) if config.position_queue_size else None
+        )
+        self._position_publisher: asyncio.Task | None = None
 
     async def update_account_size(self, *_):
         """Update the account size from the client."""
@@ -58,7 +75,7 @@ class Portfolio:
             f"with leverage {self.leverage} for portfolio {self.name}."
         )
         logger.info(msg)
-        self._account_updated.set()
+        self._account_stale = False
         return self.account_size
 
     def add_symbol(self, symbol: str | Symbol) -> set[Symbol]:
@@ -75,21 +92,65 @@ class Portfolio:
             raise ValueError(msg)
         return self.symbols
 
+    def add_symbols(self, symbols: Iterable[str | Symbol]) -> set[Symbol]:
+        """Add several symbols to the portfolio, leaving it unchanged if any of them is invalid."""
+        exchange_symbols = BinanceExchangeInfo.symbols
+        new_symbols: set[Symbol] = set()
+        for symbol in symbols:
+            if isinstance(symbol, str):
+                if symbol not in exchange_symbols:
+                    msg = f"Symbol {symbol} not found in exchange info."
+                    raise ValueError(msg)
+                symbol = exchange_symbols[symbol]  # noqa: PLW2901
+            if not isinstance(symbol, Symbol):
+                msg = f"Expected symbol to be of type Symbol, got {type(symbol)}."
+                raise TypeError(msg)
+            if symbol in self.symbols or symbol in new_symbols:
+                msg = f"Symbol {symbol} already exists in the portfolio."
+                raise ValueError(msg)
+            new_symbols.add(symbol)
+        self.symbols.update(new_symbols)
+        return self.symbols
+
     async def update_position(self, transaction_closed_event: TransactionClosedEvent):
         """Update the position with a new transaction."""
         transaction = transaction_closed_event.transaction
+        self._account_stale = True
         symbol = transaction.order.symbol
-        if symbol not in self.open_positions:
-            self.open_positions[symbol] = Position(symbol=symbol)
-        self.open_positions[symbol].update_position(transaction_closed_event)
-        await self.open_positions[symbol].publish_position()
+        position = self.open_positions.get(symbol)
+        if position is None:
+            position = self.open_positions[symbol] = Position(symbol=symbol)
+        position.update_position(transaction_closed_event)
+        if self._position_events is None:
+            await position.publish_position()
+        else:
+            if self._position_publisher is None:
+                self._position_publisher = asyncio.create_task(self._publish_positions())
+            await self._position_events.put(PositionEvent(position=position))
         # After update, if the position is closed, pop and move it to closed positions
-        if self.open_positions[symbol].is_closed:
-            position = self.open_positions.pop(symbol)
-            if symbol not in self.closed_positions:
-                self.closed_positions[symbol] = []
+        if position.is_closed:
+            del self.open_positions[symbol]
             self.closed_positions[symbol].append(position)
 
+    async def _publish_positions(self):
+        """Publish buffered position events in order, until cancelled."""
+        while True:
+            position_event = await self._position_events.get()
+            try:
+                await EventBus.publish(PositionEvent, position_event)
+            except Exception:
+                logger.exception("Failed to publish position event %s", position_event)
+            finally:
+                self._position_events.task_done()
+
+    async def flush_positions(self):
+        """Wait until every buffered position event is published, then stop the background publisher."""
+        if self._position_publisher is None:
+            return
+        await self._position_events.join()
+        self._position_publisher.cancel()
+        self._position_publisher = None
+
     async def publish_orders(self, signal_event: SignalEvent):
         if signal_event.signal == StrategyDecision.HOLD:
             return  # No orders to publish for HOLD signal
@@ -101,8 +162,15 @@ class Portfolio:
             msg = f"Invalid signal {signal_event.signal} for portfolio preparation."
             raise ValueError(msg)
         try:
-            tasks = [asyncio.create_task(self.filter_order(order)) for order in orders]
-            orders = await asyncio.gather(*tasks)
+            orders = [self._round_order(order) for order in orders]
+            # Market orders are checked against the prices the signal was generated from, so only
+            # symbols missing from the signal need a lookup, and only those calls are gathered
+            prices = signal_event.prices
+            unpriced = [order for order in orders if not (order.price or prices.get(order.symbol.name))]
+            avg_prices = iter(await asyncio.gather(*(self._get_avg_price(order) for order in unpriced)))
+            for order in orders:
+                price = order.price or prices.get(order.symbol.name) or next(avg_prices)
+                self._check_min_notional(order, price)
             await EventBus.publish(OrderCreatedEvent, OrderCreatedEvent(orders=orders))
         except (BinanceOrderMinAmountException, BinanceOrderMinTotalException) as e:
             msg = f"Orders are filtered due to: {e}"
@@ -110,23 +178,10 @@ class Portfolio:
 
     @staticmethod
     def get_order_side(hedge_ratio: float, signal: StrategyDecision) -> OrderSide:
-        # Simple lookup table approach: (hedge_ratio sign, signal) -> OrderSide
-        # hedge_ratio > 0: 1, hedge_ratio < 0: -1
-        # This reduces the conditions and branches
-        hedge_sign = 1 if hedge_ratio > 0 else -1
-
-        order_side_map = {
-            (1, StrategyDecision.LONG): OrderSide.BUY,
-            (1, StrategyDecision.SHORT): OrderSide.SELL,
-            (-1, StrategyDecision.LONG): OrderSide.SELL,
-            (-1, StrategyDecision.SHORT): OrderSide.BUY,
-        }
-
-        if hedge_ratio == 0 or (key := (hedge_sign, signal)) not in order_side_map:
+        if hedge_ratio == 0 or (side := _ORDER_SIDES.get((bool(hedge_ratio > 0), signal))) is None:
             msg = f"Invalid hedge ratio {hedge_ratio} for signal {signal}."
             raise ValueError(msg)
-
-        return order_side_map[key]
+        return side
 
     async def _prepare_entry_orders(self, signal_event: SignalEvent) -> list[Order]:
         agg_position_size = await self.leverage_sizing(signal_event)
@@ -153,74 +208,61 @@ class Portfolio:
 
     def _prepare_exit_orders(self) -> list[Order]:
         """Prepare exit orders for all positions in the portfolio."""
-        orders = []
-        for symbol, position in self.open_positions.items():
-            if position.size > 0:
-                orders.append(
-                    Order(
-                        symbol=symbol,
-                        quantity=position.size,
-                        side=OrderSide.SELL,
-                    )
-                )
-            elif position.size < 0:
-                orders.append(
-                    Order(
-                        symbol=symbol,
-                        quantity=-position.size,
-                        side=OrderSide.BUY,
-                    )
-                )
-        return orders
+        # Closed positions are dropped from open_positions, so this only walks the live legs
+        return [
+            Order(
+                symbol=symbol,
+                quantity=abs(position.size),
+                side=OrderSide.SELL if position.size > 0 else OrderSide.BUY,
+            )
+            for symbol, position in self.open_positions.items()
+            if position.size != 0
+        ]
 
-    async def filter_order(self, order: Order) -> Order:
-        """Filter order based on minimum size, etc."""
+    def _round_order(self, order: Order) -> Order:
+        """Round the order to the symbol's step sizes and check its minimum quantity."""
         if order.symbol not in self.symbols:
             msg = f"Symbol {order.symbol} not found in portfolio."
             raise ValueError(msg)
-        symbol = order.symbol
+        filters = order.symbol.filters
+        lot_size = filters.lot_size
         new_order = Order(
             symbol=order.symbol,
-            quantity=round_step_size(order.quantity, symbol.filters.lot_size.step_size),
+            quantity=round_step_size(order.quantity, lot_size.step_size),
             side=order.side,
             # Order price can be None for market orders
-            price=round_step_size(order.price, symbol.filters.price.tick_size) if order.price else None,
+            price=round_step_size(order.price, filters.price.tick_size) if order.price else None,
             side_effect=order.side_effect,
             type=order.type,
             time_in_force=order.time_in_force,
         )
-        if new_order.quantity < float(symbol.filters.lot_size.min_qty):
+        if new_order.quantity < lot_size.min_qty:
             msg = f"Order quantity {new_order.quantity} is below minimum for symbol {order.symbol}."
             raise BinanceOrderMinAmountException(msg)
-        avg_price = (
-            float((await self.client.get_avg_price(symbol=order.symbol))["price"])
-            if not new_order.price
-            else new_order.price
-        )
-        if avg_price * new_order.quantity < float(symbol.filters.notional.min_notional):
-            msg = f"Order total {avg_price * new_order.quantity} is below minimum for symbol {order.symbol}."
-            raise BinanceOrderMinTotalException(msg)
         return new_order
 
+    async def _get_avg_price(self, order: Order) -> float:
+        return float((await self.client.get_avg_price(symbol=order.symbol))["price"])
+
+    @staticmethod
+    def _check_min_notional(order: Order, price: float) -> None:
+        total = price * order.quantity
+        if total < order.symbol.filters.notional.min_notional:
+            msg = f"Order total {total} is below minimum for symbol {order.symbol}."
+            raise BinanceOrderMinTotalException(msg)
+
     async def leverage_sizing(self, signal_event: SignalEvent) -> float:
         """Calculate the size of the order based on the account size and leverage."""
-        pos_hedge_weight = sum(
-            signal_event.prices[sh.symbol] * sh.hedge_ratio
-            for sh in signal_event.hedge_ratio
-            if sh.hedge_ratio > 0
-        )
-        neg_hedge_weight = sum(
-            -signal_event.prices[sh.symbol] * sh.hedge_ratio
-            for sh in signal_event.hedge_ratio
-            if sh.hedge_ratio < 0
-        )
+        # Gross notional of one unit of the spread: long and short legs both count positively
+        prices = signal_event.prices
+        hedge_weight = sum(abs(prices[sh.symbol] * sh.hedge_ratio) for sh in signal_event.hedge_ratio)
         # TODO: Leverage sizing could be even more sophisticated
-        await self._account_updated.wait()
+        if self._account_stale:
+            await self.update_account_size()
         if self.account_size is None:
             msg = (
                 "Account size is not set. Please update the account size before calculating leverage sizing."
             )
             raise ValueError(msg)
         leveraged_size = self.account_size * (self.leverage + 1)
-        self._account_updated.clear()
-        return leveraged_size / (pos_hedge_weight + neg_hedge_weight + EPS)
+        return leveraged_size / (hedge_weight + EPS)
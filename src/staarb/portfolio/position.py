@@ -10,11 +10,10 @@ from staarb.core.types import Symbol, Transaction
 class Position:
     """A class to manage a trading position."""
 
-    position_direction: PositionDirection
-
     def __init__(self, symbol: Symbol, size: float = 0, position_id: str | None = None):
         self.symbol = symbol
         self.size = size
+        self.position_direction: PositionDirection | None = None  # Set by the first transaction
         self.entry_price = 0.0
         self.entry_time = datetime.now(tz=UTC)
         self.exit_time: datetime | None = None
@@ -43,7 +42,7 @@ class Position:
     def update_position(self, transaction_closed_event: TransactionClosedEvent):
         """Update the position with a new transaction."""
         transaction = transaction_closed_event.transaction
-        if not hasattr(self, "position_direction"):
+        if self.position_direction is None:
             is_entry = True
             self.position_direction = transaction_closed_event.position_direction
             self.entry_time = transaction.transact_time
@@ -60,18 +59,16 @@ class Position:
             raise ValueError(msg)
 
         # Calculate the signed quantity based on order side
-        base_quantity = sum(fill.base_quantity for fill in transaction.fills)
+        base_quantity, quote_quantity = transaction.fill_totals()
         signed_quantity = base_quantity if transaction.order.side == OrderSide.BUY else -base_quantity
 
         if is_entry:
             self.size += signed_quantity
             # For entry, calculate weighted average entry price
-            total_quote = sum(fill.quote_quantity for fill in transaction.fills)
             if self.size != 0:
-                self.entry_price = total_quote / abs(self.size)
+                self.entry_price = quote_quantity / abs(self.size)
         else:
-            exit_quote = sum(fill.quote_quantity for fill in transaction.fills)
-            exit_price = exit_quote / abs(signed_quantity)
+            exit_price = quote_quantity / abs(signed_quantity)
             self.close_position(exit_price, transaction.transact_time)
 
     def close_position(self, exit_price: float, exit_time: datetime):
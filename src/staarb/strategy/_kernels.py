@@ -0,0 +1,69 @@
+"""Numeric kernels used on the per-bar strategy path."""
+
+import math
+
+import numpy as np
+
+from staarb.core.jit import NUMBA_AVAILABLE, njit
+
+
+@njit(cache=True, fastmath=True, error_model="numpy")
+def _spread_zscore_loop(hedge_ratio: np.ndarray, data: np.ndarray, window: int) -> float:
+    num_assets, num_samples = data.shape
+    start = max(num_samples - window, 0)
+    mean = 0.0
+    m2 = 0.0
+    value = 0.0
+    n = 0
+    for t in range(start, num_samples):
+        value = 0.0
+        for k in range(num_assets):
+            value += hedge_ratio[k] * data[k, t]
+        # Welford's online update of the running mean and sum of squared deviations
+        n += 1
+        delta = value - mean
+        mean += delta / n
+        m2 += delta * (value - mean)
+    return (value - mean) / math.sqrt(m2 / n)
+
+
+def _spread_zscore_numpy(hedge_ratio: np.ndarray, data: np.ndarray, window: int) -> float:
+    # Only the trailing window contributes, so only it is multiplied
+    spread = hedge_ratio @ data[:, max(data.shape[1] - window, 0) :]
+    return float((spread[-1] - np.mean(spread)) / np.std(spread))
+
+
+try:
+    from staarb.strategy._kernels_aot_lib import (  # type: ignore[import-not-found]
+        spread_zscore as _spread_zscore_compiled,
+    )
+    from staarb.strategy._kernels_aot_lib import (
+        spread_zscore_f4 as _spread_zscore_compiled_f4,
+    )
+except ImportError:
+    # Fall back to the JIT-compiled loop, or to NumPy when numba is not installed
+    _spread_zscore_compiled = _spread_zscore_compiled_f4 = _spread_zscore_loop if NUMBA_AVAILABLE else None
+
+
+def spread_zscore(hedge_ratio: np.ndarray, data: np.ndarray, window: int) -> float:
+    """
+    Compute the z-score of the latest spread value over the trailing window.
+
+    Args:
+        hedge_ratio: np.ndarray 1D array with shape (num_assets,)
+        data: np.ndarray 2D array with shape (num_assets, num_samples)
+        window: number of trailing samples used for the mean and standard deviation
+
+    Returns:
+        float: z-score of the last spread value
+
+    """
+    # Only the trailing window contributes, so only it is multiplied (or copied into float64)
+    data = data[:, max(data.shape[1] - window, 0) :]
+    if _spread_zscore_compiled is not None:
+        hedge_ratio = np.ascontiguousarray(hedge_ratio, dtype=np.float64)
+        if data.dtype == np.float32:
+            # float32 klines are read as is; the spread and its moments are still accumulated in float64
+            return _spread_zscore_compiled_f4(hedge_ratio, np.ascontiguousarray(data), window)
+        return _spread_zscore_compiled(hedge_ratio, np.ascontiguousarray(data, dtype=np.float64), window)
+    return _spread_zscore_numpy(hedge_ratio, data, window)
@@ -0,0 +1,23 @@
+"""
+Ahead-of-time build of the strategy kernels.
+
+Running ``python -m staarb.strategy._kernels_aot`` (requires numba) compiles the kernels into the
+``_kernels_aot_lib`` extension module next to this file. ``staarb.strategy._kernels`` loads that
+extension when present, so CLI runs skip JIT compilation altogether.
+"""
+
+from pathlib import Path
+
+from numba.pycc import CC
+
+from staarb.strategy._kernels import _spread_zscore_loop
+
+cc = CC("_kernels_aot_lib")
+cc.output_dir = str(Path(__file__).parent)
+
+cc.export("spread_zscore", "f8(f8[::1], f8[:, ::1], i8)")(_spread_zscore_loop.py_func)
+cc.export("spread_zscore_f4", "f8(f8[::1], f4[:, ::1], i8)")(_spread_zscore_loop.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -5,6 +5,7 @@ from statsmodels.tsa.stattools import adfuller  # type: ignore[import-untyped]
 from statsmodels.tsa.vector_ar.vecm import coint_johansen  # type: ignore[import-untyped]
 
 from staarb.core.types import HedgeRatio, SingleHedgeRatio
+from staarb.strategy._kernels import spread_zscore
 
 logger = logging.getLogger(__name__)
 
@@ -96,6 +97,8 @@ class JohansenCointegrationModel:
             for symbol, hedge_ratio in zip(symbols, _hedge_ratio, strict=True)
         ]
         self._half_life_window = self.__half_life__(spread)
+        # Refreshed on every fit, so a refitted model never estimates with the previous ratios
+        self._vec_hedge_ratio = np.ascontiguousarray(_hedge_ratio, dtype=np.float64)
 
     def estimate(self, data: np.ndarray) -> float:
         """
@@ -115,11 +118,9 @@ class JohansenCointegrationModel:
             msg = "Half life window is not fitted yet."
             raise ValueError(msg)
         if not hasattr(self, "_vec_hedge_ratio"):
+            # Models built from a given hedge ratio are never fitted, so vectorize it on first use
             self._vec_hedge_ratio = np.array(
-                [single_hedge_ratio.hedge_ratio for single_hedge_ratio in self._hedge_ratio]
+                [single_hedge_ratio.hedge_ratio for single_hedge_ratio in self._hedge_ratio],
+                dtype=np.float64,
             )
-        spread = np.dot(self._vec_hedge_ratio, data)[-self._half_life_window :]
-
-        ma = np.mean(spread)
-        mstd = np.std(spread)
-        return (spread[-1] - ma) / mstd
+        return spread_zscore(self._vec_hedge_ratio, data, self._half_life_window)
@@ -1,14 +1,19 @@
+from collections.abc import Mapping
+
 import numpy as np
-from pandas import Series
+from pandas import DataFrame, Series
 
 from staarb.core.bus.event_bus import EventBus
 from staarb.core.bus.events import MarketDataEvent, SignalEvent
 from staarb.core.enums import StrategyDecision
-from staarb.core.types import HedgeRatio, LookbackRequest
+from staarb.core.types import HedgeRatio, LookbackRequest, LookbackWindow
 from staarb.strategy.base import BaseStrategy
 from staarb.strategy.johansen_model import JohansenCointegrationModel
 from staarb.strategy.signal_generator import BollingerBand
 
+# Per-asset klines, as fetched frames or as the array views of a LookbackWindow
+MarketData = Mapping[str, DataFrame | Series | np.ndarray]
+
 
 class StatisticalArbitrage(BaseStrategy):
     current_signal: StrategyDecision = StrategyDecision.HOLD
@@ -57,16 +62,32 @@ class StatisticalArbitrage(BaseStrategy):
         """
         return self.signal_model.hedge_ratio
 
-    def fit(self, market_data: dict[str, Series]):
+    @staticmethod
+    def stack_market_data(market_data: MarketData) -> np.ndarray:
+        """
+        Stack the market data of all assets into a single contiguous array.
+
+        Args:
+            market_data: A mapping containing market data for each asset.
+
+        Returns:
+            An array with shape (num_assets, num_samples), one row per asset. A LookbackWindow keeps
+            the dtype of its klines (e.g. float32); other mappings are stacked as float64.
+
+        """
+        if isinstance(market_data, LookbackWindow):
+            return market_data.to_array()
+        return np.vstack([np.asarray(data, dtype=np.float64).T for data in market_data.values()])
+
+    def fit(self, market_data: MarketData):
         """
         Fit the signal model to the market data.
 
         Args:
-            market_data: A dictionary containing market data for each asset.
+            market_data: A mapping containing market data for each asset.
 
         """
-        # Convert market data to a 2D array
-        data = np.concat([market_data[symbol].to_numpy().T for symbol in market_data], axis=0)
+        data = self.stack_market_data(market_data)
 
         # Fit the signal model
         self.signal_model.fit(data, list(market_data.keys()))
@@ -100,19 +121,18 @@ class StatisticalArbitrage(BaseStrategy):
         """
         self.signal_generator.update_position(self.current_signal)
 
-    async def generate_signal(self, market_data: dict[str, Series]):
+    async def generate_signal(self, market_data: MarketData):
         """
         Generate a trading signal based on the market data.
 
         Args:
-            market_data: A dictionary containing market data for each asset.
+            market_data: A mapping containing market data for each asset.
 
         Returns:
             A dictionary containing the generated trading signal.
 
         """
-        # Convert market data to a 2D array
-        data = np.concat([market_data[symbol].to_numpy().T for symbol in market_data], axis=0)
+        data = self.stack_market_data(market_data)
         if data.shape[0] != len(market_data.keys()):
             msg = "Market data does not match the number of assets in the model."
             raise ValueError(msg)
@@ -121,7 +141,8 @@ class StatisticalArbitrage(BaseStrategy):
 
         # Generate the trading signal
         signal = self.signal_generator.generate_signal(zscore)
-        prices = {symbol: market_data[symbol].to_numpy()[-1][0] for symbol in market_data}
+        # Each row of the stacked data is one asset, so the latest prices are its last column
+        prices = dict(zip(market_data, data[:, -1].tolist(), strict=True))
         self.current_signal = signal
         await EventBus.publish(
             SignalEvent, SignalEvent(signal=signal, hedge_ratio=self.get_hedge_ratio(), prices=prices)
@@ -9,16 +9,30 @@ from staarb.core.enums import OrderSide, PositionDirection
 from staarb.core.types import Fill, Order, Transaction
 from staarb.utils import miliseconds_to_date
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Upper bound on orders awaiting an exchange response at once. This caps concurrency only; it does
+# not limit how many orders are sent per second.
+MAX_CONCURRENT_ORDERS = 10
+
+
 class OrderExecutor:
     def __init__(
         self,
         client: AsyncClient,
+        max_concurrent_orders: int = MAX_CONCURRENT_ORDERS,
+        transaction_queue_size: int | None = None,
     ):
         self.client = client
+        self._order_slots = asyncio.Semaphore(max_concurrent_orders)
+        # Opt-in buffer that hands transaction events to a background publisher, so order execution
+        # does not wait on subscribers. Off by default: the backtest relies on the portfolio being
+        # updated before the next bar.
+        self._transaction_events: asyncio.Queue[TransactionClosedEvent] | None = (
+            asyncio.Queue(maxsize=transaction_queue_size) if transaction_queue_size else None
+        )
+        self._transaction_publisher: asyncio.Task | None = None
 
     async def execute_order(self, order_placed_event: OrderCreatedEvent):
         """
@@ -29,8 +43,17 @@ class OrderExecutor:
             msg = "No orders to execute."
             raise ValueError(msg)
 
-        tasks = [
-            self.client.create_margin_order(
+        # All orders of a basket are submitted concurrently, at most `max_concurrent_orders` at a time,
+        # and each fill is published as soon as it arrives instead of after the slowest order
+        await asyncio.gather(*(self._execute_and_publish(order) for order in orders))
+
+    async def _execute_and_publish(self, order: Order):
+        response = await self._submit_order(order)
+        await self.publish_transactions([self.create_transaction(order, response)])
+
+    async def _submit_order(self, order: Order) -> dict:
+        async with self._order_slots:
+            return await self.client.create_margin_order(
                 symbol=order.symbol.name,
                 side=order.side,
                 type=order.type,
@@ -39,14 +62,6 @@ class OrderExecutor:
                 sideEffectType=order.side_effect,
                 time_in_force=order.time_in_force,
             )
-            for order in orders
-        ]
-        responses = await asyncio.gather(*tasks)
-        transactions = [
-            self.create_transaction(order, response)
-            for order, response in zip(orders, responses, strict=True)
-        ]
-        await self.publish_transactions(transactions)
 
     async def publish_transactions(self, transactions: list[Transaction]):
         """
@@ -61,11 +76,35 @@ class OrderExecutor:
             )
             for transaction in transactions
         ]
-        tasks = [
-            asyncio.create_task(EventBus.publish(TransactionClosedEvent, tce))
-            for tce in transaction_closed_events
-        ]
-        await asyncio.gather(*tasks)
+        if self._transaction_events is not None:
+            if self._transaction_publisher is None:
+                self._transaction_publisher = asyncio.create_task(self._publish_transactions())
+            for tce in transaction_closed_events:
+                await self._transaction_events.put(tce)
+            return
+        # gather wraps each coroutine in a task itself
+        await asyncio.gather(
+            *(EventBus.publish(TransactionClosedEvent, tce) for tce in transaction_closed_events)
+        )
+
+    async def _publish_transactions(self):
+        """Publish buffered transaction events in order, until cancelled."""
+        while True:
+            transaction_closed_event = await self._transaction_events.get()
+            try:
+                await EventBus.publish(TransactionClosedEvent, transaction_closed_event)
+            except Exception:
+                logger.exception("Failed to publish transaction event %s", transaction_closed_event)
+            finally:
+                self._transaction_events.task_done()
+
+    async def flush_transactions(self):
+        """Wait until every buffered transaction event is published, then stop the background publisher."""
+        if self._transaction_publisher is None:
+            return
+        await self._transaction_events.join()
+        self._transaction_publisher.cancel()
+        self._transaction_publisher = None
 
     def create_transaction(self, order: Order, response: dict) -> Transaction:
         if not response or "fills" not in response:
@@ -1,12 +1,21 @@
 import asyncio
 import functools as ft
-from datetime import UTC, datetime
+import os
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
+from pathlib import Path
 
-import pytz
+_EPOCH = datetime.fromtimestamp(0, UTC)
+_ONE_MILLISECOND = timedelta(milliseconds=1)
 
 
-def round_step_size(quantity: float | Decimal, step_size: str) -> float:
+@ft.lru_cache(maxsize=256)
+def _step_decimal(step_size: str | float) -> Decimal:
+    # Symbols reuse a handful of step sizes, so parse each one only once
+    return Decimal(str(step_size))  # str() keeps a float step at its shortest decimal repr
+
+
+def round_step_size(quantity: float | Decimal, step_size: str | float) -> float:
     """
     Rounds a given quantity to a specific step size
 
@@ -16,10 +25,11 @@ def round_step_size(quantity: float | Decimal, step_size: str) -> float:
     :return: decimal
     """
     quantity = Decimal(str(quantity))
-    return float(quantity - quantity % Decimal(step_size))
+    step = _step_decimal(step_size)
+    return float(quantity - quantity % step)
 
 
-def date_to_milliseconds(date: datetime):
+def date_to_milliseconds(date: datetime) -> int:
     """
     Convert a date string to milliseconds since epoch.
 
@@ -27,9 +37,8 @@ def date_to_milliseconds(date: datetime):
     :return: Milliseconds since epoch.
     """
     if date.tzinfo is None or date.tzinfo.utcoffset(date) is None:
-        date = date.replace(tzinfo=pytz.utc)
-    epoch = datetime.fromtimestamp(0, UTC)
-    return int((date - epoch).total_seconds() * 1000.0)
+        date = date.replace(tzinfo=UTC)
+    return (date - _EPOCH) // _ONE_MILLISECOND
 
 
 def miliseconds_to_date(milliseconds: int) -> datetime:
@@ -48,3 +57,12 @@ def async_cmd(func):
         return asyncio.run(func(*args, **kwargs))
 
     return wrapper
+
+
+def get_cache_dir() -> Path:
+    """
+    Get the directory used for on-disk caches.
+
+    :return: The value of the STAARB_CACHE_DIR environment variable if set, else ~/.cache/staarb.
+    """
+    return Path(os.getenv("STAARB_CACHE_DIR") or Path.home() / ".cache" / "staarb")
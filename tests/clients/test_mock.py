@@ -1,11 +1,13 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 import pytest_asyncio
 
 from staarb.clients.mock import MockClient
+from staarb.core.enums import OrderSide
 from staarb.core.types import DataRequest, LookbackRequest
 
 
@@ -104,6 +106,30 @@ class TestMockClient:
             yield client
             await client.close_connection()
 
+    @pytest.mark.asyncio
+    async def test_create_without_data(self, sample_data_request):
+        """Test creating a client when no klines are returned."""
+        with (
+            patch("staarb.clients.mock.AsyncClient.create", new_callable=AsyncMock) as mock_create,
+            patch(
+                "staarb.clients.mock.MarketDataFetcher.fetch_multiple_klines", new_callable=AsyncMock
+            ) as mock_fetch,
+        ):
+            mock_create.return_value = MockClient()
+            mock_fetch.return_value = {}
+
+            client = await MockClient.create(
+                symbols=[],
+                dreq=sample_data_request,
+                balance={},
+                api_key="test_key",
+                api_secret="test_secret",  # noqa: S106
+            )
+
+            assert client._time_stamps_ms.size == 0
+            assert client._len_data == 0
+            await client.close_connection()
+
     def test_gain_asset(self, mock_client_sync):
         """Test gaining assets in mock balance."""
         mock_client_sync.gain("USDC", 500.0)
@@ -167,6 +193,12 @@ class TestMockClient:
 
         assert isinstance(current_time, datetime)
 
+    def test_get_current_time_is_utc(self, mock_client_sync):
+        """Test that the mock time is the UTC open time of the current kline."""
+        mock_client_sync.set_current_pointer(2)
+
+        assert mock_client_sync.get_current_time() == datetime(2022, 1, 2, tzinfo=UTC)
+
     def test_get_mock_data_insufficient_pointer(self, mock_client_sync):
         """Test get_mock_data with insufficient current pointer."""
         lookback_req = LookbackRequest(interval="1d", limit=10)
@@ -187,6 +219,38 @@ class TestMockClient:
         assert "ETHUSDT" in first_batch
         assert len(first_batch["BTCUSDT"]) == 2
 
+    def test_get_mock_data_yields_array_views(self, mock_client_sync):
+        """Test that mock data windows are NumPy views over the packed klines."""
+        lookback_req = LookbackRequest(interval="1d", limit=2)
+        mock_client_sync.set_current_pointer(2)
+
+        batch = next(mock_client_sync.get_mock_data(lookback_req))
+
+        assert isinstance(batch["ETHUSDT"], np.ndarray)
+        assert np.shares_memory(batch["ETHUSDT"], mock_client_sync._klines)
+        np.testing.assert_array_equal(batch["ETHUSDT"][:, 0], [3100.0, 3200.0])
+
+    def test_set_klines_keeps_float32(self, mock_client_sync):
+        """Test that klines fetched as float32 are not upcast when packed."""
+        mock_data = {
+            "BTCUSDT": pd.DataFrame({"close": [1.0, 2.0]}, dtype="float32"),
+            "ETHUSDT": pd.DataFrame({"close": [3.0, 4.0]}, dtype="float32"),
+        }
+
+        mock_client_sync.set_klines(mock_data)
+
+        assert mock_client_sync._klines.dtype == np.float32
+
+    def test_set_klines_rejects_mismatched_lengths(self, mock_client_sync):
+        """Test that symbols with different history lengths are rejected."""
+        mock_data = {
+            "BTCUSDT": pd.DataFrame({"close": [1.0, 2.0, 3.0]}),
+            "ETHUSDT": pd.DataFrame({"close": [1.0, 2.0]}),
+        }
+
+        with pytest.raises(ValueError, match="same length"):
+            mock_client_sync.set_klines(mock_data)
+
     @pytest.mark.asyncio
     async def test_get_margin_account(self, mock_client_async):
         """Test getting margin account information."""
@@ -200,6 +264,21 @@ class TestMockClient:
         assert "USDC" in asset_names
         assert "BTC" in asset_names
 
+    @pytest.mark.asyncio
+    async def test_get_margin_account_reflects_balance_changes(self, mock_client_async):
+        """Test that balances changed after a request are refreshed on the next one."""
+        await mock_client_async.get_margin_account()
+        mock_client_async.pay("USDC", 200.0)
+        mock_client_async.gain("ETH", 1.5)
+
+        user_assets = {
+            asset["asset"]: asset for asset in (await mock_client_async.get_margin_account())["userAssets"]
+        }
+
+        assert user_assets["USDC"]["free"] == "800.0"
+        assert user_assets["ETH"]["free"] == "1.5"
+        assert user_assets["BTC"]["free"] == "0.1"
+
     @pytest.mark.asyncio
     async def test_create_margin_order_buy(self, mock_client_async):
         """Test creating a buy margin order."""
@@ -233,6 +312,69 @@ class TestMockClient:
             assert result["status"] == "FILLED"
             assert result["executedQty"] == 0.05
 
+    @pytest.mark.asyncio
+    async def test_create_margin_order_accepts_order_side(self, mock_client_async):
+        """Test that OrderSide members and their string values produce the same fills."""
+        with patch("staarb.data.exchange_info_fetcher.BinanceExchangeInfo.get_symbol_info") as mock_symbol:
+            mock_symbol_obj = type("Symbol", (), {"base_asset": "BTC", "quote_asset": "USDT"})()
+            mock_symbol.return_value = mock_symbol_obj
+
+            mock_client_async.set_current_pointer(1)
+
+            enum_result = await mock_client_async.create_margin_order(
+                symbol="BTCUSDT", quantity=0.1, side=OrderSide.SELL
+            )
+            str_result = await mock_client_async.create_margin_order(
+                symbol="BTCUSDT", quantity=0.1, side="SELL"
+            )
+
+            assert enum_result["fills"] == str_result["fills"]
+            assert enum_result["fills"][0]["commissionAsset"] == "USDT"
+
+    @pytest.mark.asyncio
+    async def test_create_margin_order_fill_price_and_time(self, mock_client_async):
+        """Test that the fill uses the current close with slippage and the current timestamp."""
+        with patch("staarb.data.exchange_info_fetcher.BinanceExchangeInfo.get_symbol_info") as mock_symbol:
+            mock_symbol_obj = type("Symbol", (), {"base_asset": "ETH", "quote_asset": "USDT"})()
+            mock_symbol.return_value = mock_symbol_obj
+
+            mock_client_async.set_current_pointer(2)
+
+            result = await mock_client_async.create_margin_order(symbol="ETHUSDT", quantity=1.0, side="BUY")
+
+            assert result["fills"][0]["price"] == pytest.approx(3100.0 * (1 - 0.001))
+            assert result["transactTime"] == 1641081600000  # 2022-01-02 00:00:00 UTC
+
+    @pytest.mark.asyncio
+    async def test_create_margin_order_caches_symbol_assets(self, mock_client_async):
+        """Test that the symbol info is only looked up on the first order for a symbol."""
+        with patch("staarb.data.exchange_info_fetcher.BinanceExchangeInfo.get_symbol_info") as mock_symbol:
+            mock_symbol_obj = type("Symbol", (), {"base_asset": "BTC", "quote_asset": "USDT"})()
+            mock_symbol.return_value = mock_symbol_obj
+
+            mock_client_async.set_current_pointer(1)
+
+            await mock_client_async.create_margin_order(symbol="BTCUSDT", quantity=0.1, side="BUY")
+            result = await mock_client_async.create_margin_order(symbol="BTCUSDT", quantity=0.1, side="SELL")
+
+            mock_symbol.assert_called_once_with("BTCUSDT")
+            assert result["fills"][0]["commissionAsset"] == "USDT"
+
+    @pytest.mark.asyncio
+    async def test_preload_symbol_info(self, mock_client_async):
+        """Test that preloaded symbols do not look up the exchange info when ordering."""
+        with patch("staarb.data.exchange_info_fetcher.BinanceExchangeInfo.get_symbol_info") as mock_symbol:
+            mock_symbol_obj = type("Symbol", (), {"base_asset": "BTC", "quote_asset": "USDT"})()
+            mock_symbol.return_value = mock_symbol_obj
+
+            mock_client_async.preload_symbol_info()
+            assert mock_symbol.call_count == 2
+
+            mock_client_async.set_current_pointer(1)
+            await mock_client_async.create_margin_order(symbol="ETHUSDT", quantity=0.1, side="BUY")
+
+            assert mock_symbol.call_count == 2
+
     @pytest.mark.asyncio
     async def test_create_margin_order_unknown_symbol(self, mock_client_async):
         """Test creating order for unknown symbol raises error."""
@@ -0,0 +1,121 @@
+"""Tests for the EventBus."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from staarb.core.bus.event_bus import EventBus
+from staarb.core.bus.events import MarketDataEvent
+from staarb.core.bus.subscribers import setup_backtest_subscribers
+
+
+@pytest.fixture(autouse=True)
+def isolated_handlers(monkeypatch):
+    """Give each test an empty handler registry."""
+    monkeypatch.setattr(EventBus, "_handlers", {})
+
+
+class TestEventBus:
+    """Test EventBus subscription and publishing."""
+
+    @pytest.mark.asyncio
+    async def test_publish_calls_all_handlers(self):
+        """Test that publish awaits every subscribed handler."""
+        received = []
+
+        async def handler(data):
+            received.append(data)
+
+        EventBus.subscribe(MarketDataEvent, handler)
+        EventBus.subscribe(MarketDataEvent, handler)
+
+        await EventBus.publish(MarketDataEvent, "event")
+
+        assert received == ["event", "event"]
+
+    def test_subscribe_keeps_handler_tuples(self):
+        """Test that subscriptions are stored as tuples in subscription order."""
+
+        async def first(_):
+            pass
+
+        async def second(_):
+            pass
+
+        EventBus.subscribe(MarketDataEvent, first)
+        EventBus.subscribe(MarketDataEvent, second)
+
+        assert EventBus._handlers[MarketDataEvent] == (first, second)
+
+    @pytest.mark.asyncio
+    async def test_publish_without_handlers(self):
+        """Test that publishing an event without subscribers is a no-op."""
+        await EventBus.publish(MarketDataEvent, "event")
+
+    @pytest.mark.asyncio
+    async def test_publish_batch_preserves_order(self):
+        """Test that publish_batch delivers events in order."""
+        received = []
+
+        async def handler(data):
+            received.append(data)
+
+        EventBus.subscribe(MarketDataEvent, handler)
+
+        await EventBus.publish_batch(MarketDataEvent, iter([1, 2, 3]))
+
+        assert received == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_publish_batch_runs_handlers_concurrently(self):
+        """Test that handlers of the same event can wait on each other, as with publish."""
+        ready = asyncio.Event()
+        received = []
+
+        async def waiter(data):
+            await ready.wait()
+            received.append(data)
+            ready.clear()
+
+        async def setter(_):
+            ready.set()
+
+        EventBus.subscribe(MarketDataEvent, waiter)
+        EventBus.subscribe(MarketDataEvent, setter)
+
+        await asyncio.wait_for(EventBus.publish_batch(MarketDataEvent, [1, 2]), timeout=1)
+
+        assert received == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_publish_batch_sync_handlers(self):
+        """Test that synchronous handlers are called directly."""
+        handler = MagicMock()
+        EventBus.subscribe(MarketDataEvent, handler)
+
+        await EventBus.publish_batch(MarketDataEvent, [1, 2])
+
+        assert [call.args[0] for call in handler.call_args_list] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_publish_batch_without_handlers(self):
+        """Test that publishing a batch without subscribers consumes nothing."""
+        events = iter([1, 2])
+
+        await EventBus.publish_batch(MarketDataEvent, events)
+
+        assert next(events) == 1
+
+
+class TestBacktestSubscribers:
+    """Test the backtest event wiring."""
+
+    def test_market_data_only_reaches_the_strategy(self):
+        """Test that market data is dispatched to the strategy alone, without an account refresh."""
+        strategy = MagicMock()
+        portfolio = MagicMock()
+
+        setup_backtest_subscribers(strategy, portfolio, MagicMock())
+
+        assert EventBus._handlers[MarketDataEvent] == (strategy.on_market_data,)
@@ -0,0 +1,28 @@
+"""Tests for bus events."""
+
+from datetime import UTC, datetime
+
+from staarb.core.bus.events import SessionEvent
+from staarb.core.enums import SessionType
+
+
+class TestSessionEvent:
+    """Test SessionEvent."""
+
+    def test_generated_session_id(self):
+        """Test that the generated session ID embeds the start time and timestamp."""
+        event = SessionEvent(
+            session_type=SessionType.BACKTEST,
+            start_time=datetime(2022, 1, 2, 3, 4, 5, tzinfo=UTC),
+            timestamp=datetime(2023, 10, 11, 12, 13, 14, tzinfo=UTC),
+        )
+
+        assert event.session_id == "backtest_20220102_030405_20231011_121314"
+
+    def test_explicit_session_id_is_kept(self):
+        """Test that a provided session ID is not overwritten."""
+        event = SessionEvent(
+            session_type=SessionType.LIVE, start_time=datetime.now(UTC), session_id="session_1"
+        )
+
+        assert event.session_id == "session_1"
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from staarb.core.enums import OrderSide
@@ -6,6 +7,7 @@ from staarb.core.types import (
     Fill,
     Filters,
     LookbackRequest,
+    LookbackWindow,
     LotSizeFilter,
     Order,
     Symbol,
@@ -37,9 +39,9 @@ class TestFilters:
 
         filters = Filters(*filter_configs)
 
-        assert filters.lot_size.min_qty == "0.001"
-        assert filters.price.tick_size == "0.01"
-        assert filters.notional.min_notional == "10"
+        assert filters.lot_size.min_qty == 0.001
+        assert filters.price.tick_size == 0.01
+        assert filters.notional.min_notional == 10.0
 
 
 class TestSymbol:
@@ -143,6 +145,7 @@ class TestDataRequest:
         """Test DataRequest with default columns."""
         request = DataRequest(interval="1d", start=1640995200000, end=1641081600000)
         assert request.columns == ["close"]
+        assert request.dtype == "float64"
 
     def test_data_request_with_custom_columns(self):
         """Test DataRequest with custom columns."""
@@ -166,6 +169,30 @@ class TestLookbackRequest:
         assert request.columns == ["open", "close", "volume"]
 
 
+class TestLookbackWindow:
+    """Test LookbackWindow mapping."""
+
+    @pytest.fixture
+    def window(self):
+        """Create a window over samples 1-3 of two symbols with two columns each."""
+        klines = np.arange(2 * 5 * 2, dtype=np.float64).reshape(2, 5, 2)
+        return LookbackWindow(klines, {"BTCUSDT": 0, "ETHUSDT": 1}, start=1, end=4)
+
+    def test_lookback_window_mapping(self, window):
+        """Test that the window behaves as a read-only symbol mapping of views."""
+        assert list(window) == ["BTCUSDT", "ETHUSDT"]
+        assert len(window) == 2
+        assert "ETHUSDT" in window
+        assert np.shares_memory(window["ETHUSDT"], window.klines)
+        np.testing.assert_array_equal(window["ETHUSDT"], window.klines[1, 1:4])
+
+    def test_lookback_window_to_array(self, window):
+        """Test that to_array matches stacking the transposed per-symbol windows."""
+        expected = np.vstack([data.T for data in window.values()])
+
+        np.testing.assert_array_equal(window.to_array(), expected)
+
+
 class TestFill:
     """Test Fill class."""
 
@@ -198,6 +225,12 @@ class TestFill:
         assert fill.base_quantity == 0.099  # 0.1 - 0.001 commission
         assert fill.quote_quantity == 5000.0  # No commission deduction from quote
 
+    def test_fill_has_no_instance_dict(self, btc_symbol):
+        """Test Fill keeps all of its fields in slots."""
+        fill = Fill(symbol=btc_symbol, price=50000.0, quantity=0.1, commission=5.0, commission_asset="USDT")
+
+        assert not hasattr(fill, "__dict__")
+
 
 class TestOrder:
     """Test Order dataclass."""
@@ -310,3 +343,17 @@ class TestTransaction:
         avg_price = transaction.avg_fill_price()
         expected_avg = (2500.0 + 2505.0) / (0.0495 + 0.0495)  # quote_qty / base_qty
         assert abs(avg_price - expected_avg) < 0.01
+
+    def test_transaction_fill_totals(self, sample_order, btc_symbol):
+        """Test that fill totals are summed once and cached."""
+        fills = [
+            Fill(symbol=btc_symbol, price=50000.0, quantity=0.05, commission=25.0, commission_asset="USDT"),
+            Fill(symbol=btc_symbol, price=50100.0, quantity=0.05, commission=25.05, commission_asset="USDT"),
+        ]
+        transaction = Transaction(order=sample_order, fills=fills, transact_time=1640995200000)
+
+        base_quantity, quote_quantity = transaction.fill_totals()
+
+        assert base_quantity == pytest.approx(0.1)
+        assert quote_quantity == pytest.approx(2475.0 + 2479.95)
+        assert transaction.fill_totals() is transaction.fill_totals()
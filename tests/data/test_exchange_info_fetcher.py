@@ -0,0 +1,96 @@
+"""Tests for BinanceExchangeInfo."""
+
+import os
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from staarb.data.exchange_info_fetcher import BinanceExchangeInfo
+
+
+@pytest.fixture
+def exchange_info():
+    """Create a minimal exchange info response."""
+    return {
+        "symbols": [
+            {
+                "symbol": "BTCUSDT",
+                "baseAsset": "BTC",
+                "quoteAsset": "USDT",
+                "baseAssetPrecision": 8,
+                "quoteAssetPrecision": 8,
+                "filters": [],
+            }
+        ]
+    }
+
+
+@pytest.fixture
+def client(exchange_info):
+    """Create a client returning the exchange info."""
+    client = AsyncMock()
+    client.get_exchange_info.return_value = exchange_info
+    return client
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Point the cache directory to a temporary path."""
+    monkeypatch.setenv("STAARB_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(BinanceExchangeInfo, "symbols", {})
+    return tmp_path
+
+
+class TestBinanceExchangeInfo:
+    """Test exchange info fetching and caching."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_populates_symbols_and_cache(self, client, cache_dir):
+        """Test that a fetch fills the symbols and writes the cache file."""
+        await BinanceExchangeInfo.fetch_exchange_info(client)
+
+        assert BinanceExchangeInfo.get_symbol_info("BTCUSDT").base_asset == "BTC"
+        assert (cache_dir / BinanceExchangeInfo.cache_file_name).exists()
+        client.get_exchange_info.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_fresh_cache_skips_request(self, client):
+        """Test that a fresh cache is used instead of querying the exchange."""
+        await BinanceExchangeInfo.fetch_exchange_info(client)
+        BinanceExchangeInfo.symbols = {}
+
+        await BinanceExchangeInfo.fetch_exchange_info(client)
+
+        assert "BTCUSDT" in BinanceExchangeInfo.symbols
+        client.get_exchange_info.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_is_refreshed(self, client, cache_dir):
+        """Test that an expired cache triggers a new request."""
+        await BinanceExchangeInfo.fetch_exchange_info(client)
+        cache_file = cache_dir / BinanceExchangeInfo.cache_file_name
+        stale = time.time() - 2 * 24 * 60 * 60
+        os.utime(cache_file, (stale, stale))
+
+        await BinanceExchangeInfo.fetch_exchange_info(client)
+
+        assert client.get_exchange_info.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_always_fetches(self, client):
+        """Test that a TTL of 0 bypasses the cache."""
+        await BinanceExchangeInfo.fetch_exchange_info(client, ttl=0)
+        await BinanceExchangeInfo.fetch_exchange_info(client, ttl=0)
+
+        assert client.get_exchange_info.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_corrupt_cache_is_ignored(self, client, cache_dir):
+        """Test that an unreadable cache falls back to the exchange."""
+        (cache_dir / BinanceExchangeInfo.cache_file_name).write_text("{not json")
+
+        await BinanceExchangeInfo.fetch_exchange_info(client)
+
+        assert "BTCUSDT" in BinanceExchangeInfo.symbols
+        client.get_exchange_info.assert_awaited_once()
@@ -0,0 +1,100 @@
+"""Tests for MarketDataFetcher."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from staarb.core.types import DataRequest, LookbackRequest
+from staarb.data.ohlc_fetcher import MarketDataFetcher
+
+
+def make_kline(open_time: int, close: float) -> list:
+    """Create a raw Binance kline row."""
+    return [open_time, close, close, close, close, 1.0, open_time + 1, close, 1, 0.5, 0.5 * close, 0]
+
+
+@pytest.fixture
+def request_1d():
+    """Create a daily data request."""
+    return DataRequest(interval="1d", start=1640995200000, end=1641081600000)
+
+
+class TestMarketDataFetcher:
+    """Test klines fetching."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_klines_uses_millisecond_index(self, request_1d):
+        """Test that klines are indexed by their open time in epoch milliseconds."""
+        client = MagicMock()
+
+        async def get_historical_klines(*_, **__):
+            return [make_kline(1640995200000, 50000.0), make_kline(1641081600000, 51000.0)]
+
+        client.get_historical_klines = get_historical_klines
+
+        klines = await MarketDataFetcher.fetch_klines(client, "BTCUSDT", request_1d)
+
+        assert list(klines.index) == [1640995200000, 1641081600000]
+        assert list(klines["close"]) == [50000.0, 51000.0]
+
+    @pytest.mark.asyncio
+    async def test_fetch_multiple_klines_bounds_concurrency(self, request_1d):
+        """Test that no more than `concurrency` requests are in flight at once."""
+        client = MagicMock()
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_historical_klines(symbol, *_, **__):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [make_kline(1640995200000, float(len(symbol)))]
+
+        client.get_historical_klines = get_historical_klines
+        symbols = ["BTCUSDT", "ETHUSDT", "BNBUSDT", "SOLUSDT", "XRPUSDT"]
+
+        klines = await MarketDataFetcher.fetch_multiple_klines(client, symbols, request_1d, concurrency=2)
+
+        assert list(klines) == symbols
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_klines_reuses_disk_cache(self, request_1d, tmp_path, monkeypatch):
+        """Test that a cached window is read back from disk instead of being fetched again."""
+        monkeypatch.setenv("STAARB_CACHE_DIR", str(tmp_path))
+        client = MagicMock()
+        calls = 0
+
+        async def get_historical_klines(*_, **__):
+            nonlocal calls
+            calls += 1
+            return [make_kline(1640995200000, 50000.0), make_kline(1641081600000, 51000.0)]
+
+        client.get_historical_klines = get_historical_klines
+
+        fetched = await MarketDataFetcher.fetch_klines(client, "BTCUSDT", request_1d, cache=True)
+        cached = await MarketDataFetcher.fetch_klines(client, "BTCUSDT", request_1d, cache=True)
+
+        assert calls == 1
+        pd.testing.assert_frame_equal(cached, fetched)
+
+    @pytest.mark.asyncio
+    async def test_fetch_klines_does_not_cache_lookback(self, tmp_path, monkeypatch):
+        """Test that lookback requests always query the exchange."""
+        monkeypatch.setenv("STAARB_CACHE_DIR", str(tmp_path))
+        client = MagicMock()
+
+        async def get_historical_klines(*_, **__):
+            return [make_kline(1640995200000, 50000.0)]
+
+        client.get_historical_klines = get_historical_klines
+
+        request = LookbackRequest(interval="1d", limit=1)
+
+        await MarketDataFetcher.fetch_klines(client, "BTCUSDT", request, cache=True)
+
+        assert not (tmp_path / MarketDataFetcher.cache_dir_name).exists()
@@ -1,6 +1,9 @@
 """Tests for TradingStorage class."""
 
+import asyncio
 import tempfile
+import threading
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import patch
@@ -100,6 +103,20 @@ class TestTradingStorage:
         for table in expected_tables:
             assert table in table_names
 
+    def test_sqlite_uses_wal_journal(self, storage):
+        """Test that SQLite connections are configured for write-ahead logging."""
+        with storage.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+
+    def test_sqlite_sessions_share_one_connection(self, storage):
+        """Test that SQLite sessions reuse a single pooled connection."""
+        with storage.engine.connect() as first:
+            first_dbapi = first.connection.dbapi_connection
+        with storage.engine.connect() as second:
+            assert second.connection.dbapi_connection is first_dbapi
+            assert second.exec_driver_sql("PRAGMA busy_timeout").scalar() == 30000
+
     async def test_save_session_success(self, storage, sample_session_event):
         """Test successful session start."""
         await storage.save_session(sample_session_event)
@@ -200,8 +217,8 @@ class TestTradingStorage:
             db_fills = db_session.exec(select(DbFill)).all()
             assert len(db_fills) == 2
 
-    def test_add_transaction_creates_related_objects(self, storage, sample_position, sample_transaction):
-        """Test that _add_transaction creates transaction, order, and fill objects."""
+    def test_add_transactions_creates_related_objects(self, storage, sample_position, sample_transaction):
+        """Test that _add_transactions creates transaction, order, and fill rows."""
         # This is a unit test for the private method
         engine = storage.engine
 
@@ -223,8 +240,8 @@ class TestTradingStorage:
             db_session.commit()
             db_session.refresh(db_position)
 
-            # Call _add_transaction
-            storage._add_transaction(sample_transaction, db_position, db_session)
+            # Call _add_transactions
+            storage._add_transactions([sample_transaction], db_position.id, db_session)
             db_session.commit()
 
             # Verify transaction was created
@@ -269,21 +286,68 @@ class TestTradingStorage:
             mock_get_unsaved.assert_called_once()
             mock_mark_saved.assert_called_once_with(len(sample_position.transaction_history))
 
-    def test_storage_with_different_database_url(self):
+    def test_storage_with_different_database_url(self, tmp_path):
         """Test TradingStorage with different database URL."""
-        custom_url = "sqlite:///custom_test.db"
+        custom_url = f"sqlite:///{tmp_path / 'custom_test.db'}"
         storage = TradingStorage(custom_url)
 
         assert str(storage.engine.url) == custom_url
+        storage.engine.dispose()
 
-        # Cleanup
-        Path("custom_test.db").unlink(missing_ok=True)
+    async def test_concurrent_saves_are_serialized_off_the_event_loop(
+        self, storage, sample_session_event, btc_symbol
+    ):
+        """Test that concurrent position saves write one at a time without blocking the event loop."""
+        await storage.save_session(sample_session_event)
+        positions = [Position(symbol=btc_symbol, size=0.1 * (i + 1)) for i in range(4)]
+
+        write_position = storage._write_position
+        counter_lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def slow_write(position):
+            nonlocal in_flight, max_in_flight
+            with counter_lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            try:
+                time.sleep(0.02)  # A blocking write, as a slow disk would cause
+                write_position(position)
+            finally:
+                with counter_lock:
+                    in_flight -= 1
+
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        with patch.object(storage, "_write_position", side_effect=slow_write):
+            heartbeat_task = asyncio.create_task(heartbeat())
+            await asyncio.gather(
+                *(storage.save_position(PositionEvent(position=position)) for position in positions)
+            )
+            heartbeat_task.cancel()
+
+        assert max_in_flight == 1
+        # The loop kept running while the writes blocked their worker thread for about 80ms
+        assert ticks >= 4
+        with Session(storage.engine) as db_session:
+            saved_sizes = sorted(p.size for p in db_session.exec(select(DbPosition)).all())
+        assert saved_sizes == pytest.approx([0.1, 0.2, 0.3, 0.4])
 
-    def test_storage_default_database_url(self):
+    def test_storage_default_database_url(self, tmp_path, monkeypatch):
         """Test TradingStorage with default database URL."""
+        # The default database is relative to the working directory
+        monkeypatch.chdir(tmp_path)
         storage = TradingStorage()
 
         assert "sqlite:///trading_data.db" in str(storage.engine.url)
+        storage.engine.dispose()
 
     async def test_save_position_without_session_raises_error(self, storage, sample_position):
         """Test that saving position without starting session first raises error."""
@@ -0,0 +1,285 @@
+"""Tests for the portfolio."""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from staarb.core.bus.event_bus import EventBus
+from staarb.core.bus.events import OrderCreatedEvent, PositionEvent, SignalEvent, TransactionClosedEvent
+from staarb.core.enums import OrderSide, PositionDirection, StrategyDecision
+from staarb.core.types import Fill, Order, SingleHedgeRatio, Symbol, Transaction
+from staarb.data.exchange_info_fetcher import BinanceExchangeInfo
+from staarb.portfolio.portfolio import Portfolio, PortfolioConfig
+from staarb.portfolio.position import Position
+
+
+def make_symbol(name: str, base_asset: str) -> Symbol:
+    """Create a symbol with lot size, price and notional filters."""
+    return Symbol(
+        symbol=name,
+        baseAsset=base_asset,
+        quoteAsset="USDC",
+        baseAssetPrecision=8,
+        quoteAssetPrecision=8,
+        filters=[
+            {"filterType": "LOT_SIZE", "minQty": "0.001", "maxQty": "9000", "stepSize": "0.001"},
+            {"filterType": "PRICE_FILTER", "minPrice": "0.01", "maxPrice": "1000000", "tickSize": "0.01"},
+            {"filterType": "NOTIONAL", "minNotional": "5", "maxNotional": "9000000"},
+        ],
+    )
+
+
+def make_transaction_event(symbol: Symbol, side: OrderSide, quantity: float, price: float):
+    """Create a closed transaction event with a single fill."""
+    transaction = Transaction(
+        order=Order(symbol=symbol, quantity=quantity, side=side),
+        fills=[Fill(symbol, price=price, quantity=quantity, commission=0.0, commission_asset="USDC")],
+        transact_time=datetime.now(tz=UTC),
+    )
+    direction = PositionDirection.LONG if side == OrderSide.BUY else PositionDirection.SHORT
+    return TransactionClosedEvent(transaction=transaction, position_direction=direction)
+
+
+def make_position(symbol: Symbol, size: float) -> Position:
+    """Create an open position of the given signed size."""
+    return Position(symbol=symbol, size=size)
+
+
+@pytest.fixture(autouse=True)
+def isolated_handlers(monkeypatch):
+    """Give each test an empty handler registry."""
+    monkeypatch.setattr(EventBus, "_handlers", {})
+
+
+@pytest.fixture
+def btc():
+    """Create the BTC symbol."""
+    return make_symbol("BTCUSDC", "BTC")
+
+
+@pytest.fixture
+def eth():
+    """Create the ETH symbol."""
+    return make_symbol("ETHUSDC", "ETH")
+
+
+@pytest.fixture
+def exchange_symbols(monkeypatch, btc, eth):
+    """Register the test symbols as the exchange info."""
+    monkeypatch.setattr(BinanceExchangeInfo, "symbols", {btc.name: btc, eth.name: eth})
+
+
+@pytest.fixture
+def client():
+    """Create a mock client holding 1000 USDC."""
+    client = AsyncMock()
+    client.get_margin_account.return_value = {"userAssets": [{"asset": "USDC", "free": "1000.0"}]}
+    client.get_avg_price.return_value = {"price": "1.0"}
+    return client
+
+
+@pytest.fixture
+def portfolio(client, exchange_symbols, btc, eth):  # noqa: ARG001
+    """Create a portfolio trading the test symbols."""
+    portfolio = Portfolio("test", client, PortfolioConfig(leverage=1.0))
+    portfolio.add_symbols([btc, eth])
+    return portfolio
+
+
+@pytest.fixture
+def published_orders():
+    """Collect the orders of every published OrderCreatedEvent."""
+    published: list[list[Order]] = []
+
+    async def subscriber(order_created_event):
+        published.append(order_created_event.orders)
+
+    EventBus.subscribe(OrderCreatedEvent, subscriber)
+    return published
+
+
+def make_signal(signal: StrategyDecision, prices: dict[str, float]) -> SignalEvent:
+    """Create a signal for a BTC/ETH spread."""
+    return SignalEvent(
+        signal=signal,
+        hedge_ratio=[SingleHedgeRatio("BTCUSDC", 1.0), SingleHedgeRatio("ETHUSDC", -2.0)],
+        prices=prices,
+    )
+
+
+class TestAddSymbols:
+    """Test bulk symbol registration."""
+
+    def test_adds_names_and_symbols(self, client, exchange_symbols, btc, eth):  # noqa: ARG002
+        """Test that symbol names are resolved from the exchange info and Symbols are added as is."""
+        portfolio = Portfolio("test", client)
+
+        assert portfolio.add_symbols(["BTCUSDC", eth]) == {btc, eth}
+
+    def test_duplicate_leaves_portfolio_unchanged(self, client, exchange_symbols, btc):  # noqa: ARG002
+        """Test that a duplicate symbol raises without adding any of the symbols."""
+        portfolio = Portfolio("test", client)
+        portfolio.add_symbol(btc)
+
+        with pytest.raises(ValueError, match="already exists"):
+            portfolio.add_symbols(["ETHUSDC", "BTCUSDC"])
+        with pytest.raises(ValueError, match="already exists"):
+            portfolio.add_symbols(["ETHUSDC", "ETHUSDC"])
+
+        assert portfolio.symbols == {btc}
+
+    def test_unknown_and_invalid_symbols(self, client, exchange_symbols):  # noqa: ARG002
+        """Test that unknown names and non-symbols are rejected."""
+        portfolio = Portfolio("test", client)
+
+        with pytest.raises(ValueError, match="not found in exchange info"):
+            portfolio.add_symbols(["ETHUSDC", "DOGEUSDC"])
+        with pytest.raises(TypeError, match="Expected symbol"):
+            portfolio.add_symbols([42])
+
+        assert portfolio.symbols == set()
+
+
+class TestPublishOrders:
+    """Test order preparation and filtering."""
+
+    @pytest.mark.asyncio
+    async def test_entry_orders_are_checked_against_signal_prices(self, portfolio, client, published_orders):
+        """Test that market orders use the signal's prices for the notional check."""
+        signal = make_signal(StrategyDecision.LONG, {"BTCUSDC": 100.0, "ETHUSDC": 25.0})
+
+        await portfolio.publish_orders(signal)
+
+        client.get_avg_price.assert_not_awaited()
+        assert len(published_orders) == 1
+        # 1000 USDC * (1 + 1) leverage / (100 * 1 + 25 * 2) gross notional per unit of spread
+        assert [(order.symbol.name, order.side, order.quantity) for order in published_orders[0]] == [
+            ("BTCUSDC", OrderSide.BUY, 13.333),
+            ("ETHUSDC", OrderSide.SELL, 26.666),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_orders_below_min_notional_at_signal_price_are_filtered(
+        self, portfolio, client, published_orders, btc
+    ):
+        """Test that the signal price, not the average price, decides the minimum notional check."""
+        client.get_avg_price.return_value = {"price": "1000000.0"}
+        portfolio.open_positions[btc] = make_position(btc, 0.01)
+
+        await portfolio.publish_orders(make_signal(StrategyDecision.EXIT, {"BTCUSDC": 100.0}))
+
+        client.get_avg_price.assert_not_awaited()
+        assert published_orders == []
+
+    @pytest.mark.asyncio
+    async def test_symbols_missing_from_signal_fall_back_to_avg_price(
+        self, portfolio, client, published_orders, btc, eth
+    ):
+        """Test that only orders without a signal price look up the average price."""
+        portfolio.open_positions[btc] = make_position(btc, 1.0)
+        portfolio.open_positions[eth] = make_position(eth, -2.0)
+        client.get_avg_price.return_value = {"price": "30.0"}
+
+        await portfolio.publish_orders(make_signal(StrategyDecision.EXIT, {"BTCUSDC": 100.0}))
+
+        client.get_avg_price.assert_awaited_once()
+        assert client.get_avg_price.await_args.kwargs["symbol"].name == "ETHUSDC"
+        assert len(published_orders[0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_hold_publishes_nothing(self, portfolio, published_orders):
+        """Test that a HOLD signal creates no orders."""
+        await portfolio.publish_orders(make_signal(StrategyDecision.HOLD, {}))
+
+        assert published_orders == []
+
+
+class TestExitOrders:
+    """Test exit order preparation."""
+
+    def test_exit_orders_close_every_open_leg(self, portfolio, btc, eth):
+        """Test that long legs are sold, short legs are bought back and flat legs are skipped."""
+        sol = make_symbol("SOLUSDC", "SOL")
+        portfolio.open_positions = {
+            btc: make_position(btc, 1.5),
+            eth: make_position(eth, -3.0),
+            sol: make_position(sol, 0.0),
+        }
+
+        orders = portfolio._prepare_exit_orders()
+
+        assert [(order.symbol.name, order.side, order.quantity) for order in orders] == [
+            ("BTCUSDC", OrderSide.SELL, 1.5),
+            ("ETHUSDC", OrderSide.BUY, 3.0),
+        ]
+
+    def test_no_open_positions(self, portfolio):
+        """Test that an empty portfolio has no exit orders."""
+        assert portfolio._prepare_exit_orders() == []
+
+
+class TestAccountRefresh:
+    """Test the lazy account size refresh."""
+
+    @pytest.mark.asyncio
+    async def test_account_is_fetched_only_after_fills(self, portfolio, client, btc):
+        """Test that sizing reuses the account size until a transaction marks it stale."""
+        signal = make_signal(StrategyDecision.LONG, {"BTCUSDC": 100.0, "ETHUSDC": 25.0})
+
+        await portfolio.leverage_sizing(signal)
+        await portfolio.leverage_sizing(signal)
+        assert client.get_margin_account.await_count == 1
+
+        await portfolio.update_position(make_transaction_event(btc, OrderSide.BUY, 1.0, 100.0))
+        client.get_margin_account.return_value = {"userAssets": [{"asset": "USDC", "free": "500.0"}]}
+        size = await portfolio.leverage_sizing(signal)
+
+        assert client.get_margin_account.await_count == 2
+        assert portfolio.account_size == 500.0
+        assert size == pytest.approx(500.0 * 2 / 150.0, rel=1e-6)
+
+
+class TestPositionQueue:
+    """Test the opt-in position event queue."""
+
+    @pytest.mark.asyncio
+    async def test_queued_positions_are_published_in_order_and_flushed(self, btc, eth):
+        """Test that buffered position events do not block updates and are all published on flush."""
+        release = asyncio.Event()
+        published = []
+
+        async def slow_subscriber(position_event):
+            await release.wait()
+            published.append(position_event.position.symbol.name)
+
+        EventBus.subscribe(PositionEvent, slow_subscriber)
+        portfolio = Portfolio("test", AsyncMock(), PortfolioConfig(position_queue_size=8))
+
+        await portfolio.update_position(make_transaction_event(btc, OrderSide.BUY, 1.0, 100.0))
+        await portfolio.update_position(make_transaction_event(eth, OrderSide.SELL, 2.0, 50.0))
+        assert published == []
+
+        release.set()
+        await portfolio.flush_positions()
+
+        assert published == ["BTCUSDC", "ETHUSDC"]
+        assert portfolio._position_publisher is None
+
+    @pytest.mark.asyncio
+    async def test_positions_are_published_inline_by_default(self, btc):
+        """Test that without a queue, each position event is published before update_position returns."""
+        published = []
+
+        async def subscriber(position_event):
+            published.append(position_event.position.symbol.name)
+
+        EventBus.subscribe(PositionEvent, subscriber)
+        portfolio = Portfolio("test", AsyncMock())
+
+        await portfolio.update_position(make_transaction_event(btc, OrderSide.BUY, 1.0, 100.0))
+
+        assert published == ["BTCUSDC"]
+        assert portfolio._position_publisher is None
+        await portfolio.flush_positions()  # Nothing buffered, so this returns immediately
@@ -88,6 +88,21 @@ class TestJohansenCointegrationModel:
         # Check that hedge ratio is normalized (first component should be 1.0)
         assert model._hedge_ratio[0].hedge_ratio == 1.0
 
+    def test_refit_refreshes_vec_hedge_ratio(self):
+        """Test that refitting replaces the hedge ratio vector used by estimate."""
+        model = JohansenCointegrationModel()
+        np.random.seed(42)
+        n = 100
+        common_trend = np.cumsum(np.random.normal(0, 1, n))
+        series1 = common_trend + np.random.normal(0, 0.1, n)
+        symbols = ["BTCUSDT", "ETHUSDT"]
+
+        model.fit(np.array([series1, 2 * common_trend + np.random.normal(0, 0.1, n)]), symbols)
+        model.fit(np.array([series1, 3 * common_trend + np.random.normal(0, 0.1, n)]), symbols)
+
+        expected = [single_hedge_ratio.hedge_ratio for single_hedge_ratio in model._hedge_ratio]
+        np.testing.assert_array_equal(model._vec_hedge_ratio, expected)
+
     def test_estimate_not_fitted(self):
         """Test estimate raises error when not fitted."""
         model = JohansenCointegrationModel()
@@ -0,0 +1,49 @@
+"""Tests for the strategy numeric kernels."""
+
+import numpy as np
+import pytest
+
+from staarb.strategy._kernels import _spread_zscore_loop, _spread_zscore_numpy, spread_zscore
+
+
+class TestSpreadZscore:
+    """Test cases for the spread z-score kernel."""
+
+    @pytest.fixture
+    def data(self):
+        """Create random price data for two assets."""
+        rng = np.random.default_rng(42)
+        return rng.random((2, 50))
+
+    @pytest.fixture
+    def hedge_ratio(self):
+        """Create a simple hedge ratio vector."""
+        return np.array([1.0, -0.5])
+
+    def test_matches_numpy_reference(self, hedge_ratio, data):
+        """Test that the loop kernel matches the NumPy mean/std computation."""
+        spread = np.dot(hedge_ratio, data)[-20:]
+        expected = (spread[-1] - np.mean(spread)) / np.std(spread)
+
+        assert _spread_zscore_loop(hedge_ratio, data, 20) == pytest.approx(expected)
+        assert _spread_zscore_numpy(hedge_ratio, data, 20) == pytest.approx(expected)
+
+    def test_window_larger_than_data(self, hedge_ratio, data):
+        """Test that a window longer than the data uses all samples."""
+        assert _spread_zscore_loop(hedge_ratio, data, 100) == pytest.approx(
+            _spread_zscore_numpy(hedge_ratio, data, 100)
+        )
+
+    def test_accepts_non_contiguous_input(self, hedge_ratio, data):
+        """Test that Fortran-ordered input is handled."""
+        zscore = spread_zscore(hedge_ratio, np.asfortranarray(data), 20)
+
+        assert isinstance(zscore, float)
+        assert zscore == pytest.approx(_spread_zscore_numpy(hedge_ratio, data, 20))
+
+    def test_accepts_float32_input(self, hedge_ratio, data):
+        """Test that float32 data gives the same z-score as float64 data, up to float32 rounding."""
+        zscore = spread_zscore(hedge_ratio, data.astype(np.float32), 20)
+
+        assert isinstance(zscore, float)
+        assert zscore == pytest.approx(spread_zscore(hedge_ratio, data, 20), rel=1e-4)
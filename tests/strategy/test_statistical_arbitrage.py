@@ -103,6 +103,20 @@ class TestStatisticalArbitrage:
         assert isinstance(data, np.ndarray)
         assert symbols == ["BTCUSDT", "ETHUSDT"]
 
+    def test_stack_market_data(self):
+        """Test stacking series and single-column frames into one row per asset."""
+        market_data = {
+            "BTCUSDT": pd.Series([50000, 51000, 52000]),
+            "ETHUSDT": pd.DataFrame({"close": [3000, 3100, 3200]}),
+        }
+
+        data = StatisticalArbitrage.stack_market_data(market_data)
+
+        assert data.shape == (2, 3)
+        assert data.dtype == np.float64
+        assert data.flags.c_contiguous
+        np.testing.assert_array_equal(data[1], [3000.0, 3100.0, 3200.0])
+
     @pytest.mark.asyncio
     async def test_on_market_data_not_fitted(self):
         """Test handling market data when strategy is not fitted."""
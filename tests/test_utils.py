@@ -26,6 +26,17 @@ class TestRoundStepSize:
         result = round_step_size("12.3456", "0.1")
         assert result == 12.3
 
+    def test_round_step_size_with_float_step(self):
+        """Test with a step size parsed to float from the exchange filters."""
+        assert round_step_size(12.3456, 0.01) == 12.34
+        assert round_step_size(0.123456789, 0.00001) == 0.12345
+
+    def test_round_step_size_exact_at_step_boundary(self):
+        """Test quantities on a step boundary, where float floor division drops a step."""
+        assert round_step_size(0.29, 0.01) == 0.29
+        assert round_step_size(0.3, 0.1) == 0.3
+        assert round_step_size(1.15, "0.05") == 1.15
+
     def test_round_step_size_edge_cases(self):
         """Test edge cases for step size rounding."""
         # Test with zero
@@ -160,10 +160,12 @@ class TestOrderExecutor:
             # Verify client was called twice
             assert mock_client.create_margin_order.call_count == 2
 
-            # Verify transactions were published
-            mock_publish.assert_called_once()
-            transactions = mock_publish.call_args[0][0]
-            assert len(transactions) == 2
+            # Verify each transaction was published on its own as soon as its order filled
+            assert mock_publish.call_count == 2
+            for call in mock_publish.call_args_list:
+                transactions = call[0][0]
+                assert len(transactions) == 1
+                assert isinstance(transactions[0], Transaction)
 
     @pytest.mark.asyncio
     async def test_execute_order_empty_orders_list(self, mock_client):
@@ -347,6 +349,83 @@ class TestOrderExecutor:
         assert end_time - start_time < 0.15, "Orders should be executed concurrently"
         assert mock_client.create_margin_order.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_order_submission_is_bounded(
+        self, mock_client, sample_multiple_orders_event, sample_binance_response
+    ):
+        """Test that no more than max_concurrent_orders orders are in flight at once."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def delayed_response(*_args, **_kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return sample_binance_response
+
+        mock_client.create_margin_order.side_effect = delayed_response
+
+        executor = OrderExecutor(mock_client, max_concurrent_orders=1)
+
+        with patch.object(executor, "publish_transactions"):
+            await executor.execute_order(sample_multiple_orders_event)
+
+        assert max_in_flight == 1
+        assert mock_client.create_margin_order.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fast_fill_is_published_before_slow_order_returns(
+        self, mock_client, sample_multiple_orders_event, sample_binance_response
+    ):
+        """Test that a filled order does not wait for the rest of the basket before publishing."""
+        pending = asyncio.Event()
+        published_while_pending = []
+
+        async def response_by_side(*_args, side, **_kwargs):
+            if side == OrderSide.SELL:
+                await pending.wait()
+            return sample_binance_response
+
+        async def record_publish(_transactions):
+            published_while_pending.append(not pending.is_set())
+            pending.set()
+
+        mock_client.create_margin_order.side_effect = response_by_side
+
+        executor = OrderExecutor(mock_client)
+
+        with patch.object(executor, "publish_transactions", side_effect=record_publish):
+            await executor.execute_order(sample_multiple_orders_event)
+
+        assert published_while_pending == [True, False]
+
+    @pytest.mark.asyncio
+    async def test_queued_transactions_do_not_block_execution(
+        self, mock_client, sample_order_created_event, sample_binance_response
+    ):
+        """Test that with a transaction queue, execution returns before subscribers finish."""
+        mock_client.create_margin_order.return_value = sample_binance_response
+        release = asyncio.Event()
+        published = []
+
+        async def slow_publish(_event_type, event):
+            await release.wait()
+            published.append(event)
+
+        executor = OrderExecutor(mock_client, transaction_queue_size=4)
+
+        with patch("staarb.core.bus.event_bus.EventBus.publish", side_effect=slow_publish):
+            await executor.execute_order(sample_order_created_event)
+            assert published == []
+
+            release.set()
+            await executor.flush_transactions()
+
+        assert len(published) == 1
+        assert published[0].transaction.order.symbol.name == "BTCUSDT"
+
     def test_create_transaction_data_types(self, mock_client, sample_order):
         """Test that transaction creation handles string-to-float conversion properly."""
         # Modify response to have string values (as they come from API)